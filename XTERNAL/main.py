@@ -30,23 +30,34 @@ APP_INFO = {
 }
 
 import os
+import re
 import sys
 import time
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import threading
 import subprocess
 import shutil
 import json
 import hashlib
+import mmap
 import urllib.parse
-from concurrent.futures import ThreadPoolExecutor
-from ftplib import FTP
+import platform
+import functools
+import importlib.metadata
+import importlib.util
+import statistics
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from ftplib import FTP, FTP_TLS
 from pathlib import Path
 from datetime import datetime
-import socket
 import ssl
-import argparse
-from typing import List
+from typing import List, Optional
+from dataclasses import dataclass
+from types import SimpleNamespace
 import configparser
 import getpass
 
@@ -86,20 +97,120 @@ class Colors:
     UNDERLINE = '\033[4m'
     END = '\033[0m'
 
+# Plain text when output is piped or NO_COLOR is set
+if os.environ.get('NO_COLOR') or not (sys.stdout and sys.stdout.isatty()):
+    for _name in [name for name in vars(Colors) if name.isupper()]:
+        setattr(Colors, _name, '')
+
+# Menu tree prefixes, interpolated once instead of on every print
+INFO_L = f"{Colors.INFO}├─{Colors.END}"
+INFO_V = f"{Colors.INFO}│{Colors.END}"
+INFO_E = f"{Colors.INFO}╰─{Colors.END}"
+ACC_L = f"{Colors.ACCENT}├─{Colors.END}"
+ACC_V = f"{Colors.ACCENT}│{Colors.END}"
+ACC_E = f"{Colors.ACCENT}╰─{Colors.END}"
+
+# Progress bars are built once for every fill level of each width, so a redraw is a single tuple index
+_BAR_FULL = '█' * 50
+_BAR_SHADE = '▒' * 50
+_BAR_LIGHT = '░' * 50
+_BARS_40 = tuple(_BAR_FULL[:i] + _BAR_LIGHT[i:40] for i in range(41))
+_BARS_40_SHADE = tuple(_BAR_FULL[:i] + _BAR_SHADE[i:40] for i in range(41))
+_BARS_50 = tuple(_BAR_FULL[:i] + _BAR_LIGHT[i:] for i in range(51))
+PROGRESS_INTERVAL = 0.1
+# Bytes -> MiB as one multiply in progress output; whole-MiB integer counts use >> 20
+_MIB = 1.0 / (1024 * 1024)
+# y/n prompts look only at the first character typed
+_YES = frozenset('yY')
+_NO = frozenset('nN')
+_YES_NO = _YES | _NO
+
+# yt-dlp and paramiko are slow to import, so they are loaded on first use (None = not tried yet)
+yt_dlp = None
+YTDLP_AVAILABLE = None
+paramiko = None
+SFTP_AVAILABLE = None
+
+def load_ytdlp(retry=False):
+    """Import yt_dlp on first call; returns whether it is available (retry=True tries again after a failure)"""
+    global yt_dlp, YTDLP_AVAILABLE
+    if retry and not YTDLP_AVAILABLE:
+        # Pick up a package installed since the last attempt without restarting
+        importlib.invalidate_caches()
+        YTDLP_AVAILABLE = None
+    if YTDLP_AVAILABLE is None:
+        try:
+            import yt_dlp as _yt_dlp
+            yt_dlp = _yt_dlp
+            YTDLP_AVAILABLE = True
+        except ImportError:
+            YTDLP_AVAILABLE = False
+    return YTDLP_AVAILABLE
+
+def load_paramiko():
+    """Import paramiko on first call; returns whether it is available"""
+    global paramiko, SFTP_AVAILABLE
+    if SFTP_AVAILABLE is None:
+        try:
+            import paramiko as _paramiko
+            paramiko = _paramiko
+            SFTP_AVAILABLE = True
+        except ImportError:
+            SFTP_AVAILABLE = False
+    return SFTP_AVAILABLE
+
+def ytdlp_installed():
+    """Check for yt_dlp without importing it"""
+    return YTDLP_AVAILABLE if YTDLP_AVAILABLE is not None else importlib.util.find_spec('yt_dlp') is not None
+
 try:
-    import yt_dlp
-    YTDLP_AVAILABLE = True
+    import psutil
+    PSUTIL_AVAILABLE = True
 except ImportError:
-    YTDLP_AVAILABLE = False
+    PSUTIL_AVAILABLE = False
 
 try:
-    import paramiko
-    SFTP_AVAILABLE = True
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
 except ImportError:
-    SFTP_AVAILABLE = False
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import httpx
+    # httpx needs the h2 package to negotiate HTTP/2; it is never used directly
+    HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _json_dumps(obj, indent=False):
+    """Serialize obj to UTF-8 JSON bytes, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+def _json_loads(data):
+    """Parse JSON from bytes or str, using orjson when it is installed"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+def _load_json_file(path):
+    """Parse a JSON file; orjson reads it straight out of a read-only memory map instead of a copied buffer"""
+    with open(path, 'rb') as f:
+        if ORJSON_AVAILABLE and os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        return _json_loads(f.read())
 
 # Configuration file path
 CONFIG_FILE = os.path.expanduser("~/.xternal_config.ini")
+HISTORY_FILE = os.path.expanduser("~/.xternal_history.json")
+# Histories larger than this are streamed to disk row by row rather than encoded into one string
+HISTORY_STREAM_EXPORT = 10000
 
 # Default configuration
 DEFAULT_CONFIG = {
@@ -128,6 +239,9 @@ DEFAULT_CONFIG = {
     'download_history': True,
     'notification_sound': True,
     'auto_extract': False,
+    'write_info_json': False,
+    'write_subs': False,
+    'write_auto_subs': False,
     'schedule_downloads': False,
     'mirror_urls': [],
     'blocked_extensions': ['.exe', '.scr', '.bat', '.cmd'],
@@ -155,35 +269,356 @@ STATS = {
     'average_speed': 0
 }
 
-DOWNLOAD_HISTORY = []
+@functools.lru_cache(maxsize=128)
+def _fmt_ts(ns, fmt="%m/%d %H:%M"):
+    """Format a time.time_ns() history timestamp for display (memoized, so reopening the history view is lookups)"""
+    return datetime.fromtimestamp(ns / 1e9).strftime(fmt)
+
+def _record_ts(record):
+    """timestamp_ns of a history record; records saved before it existed carry an ISO 'timestamp'"""
+    if 'timestamp_ns' in record:
+        return record['timestamp_ns']
+    try:
+        return int(datetime.fromisoformat(record['timestamp']).timestamp() * 1e9)
+    except (KeyError, TypeError, ValueError):
+        return 0
+
+class DownloadHistory:
+    """Download history stored as one column per field; rows are built as dicts on demand"""
+    
+    def __init__(self, records=()):
+        self.url = []
+        self.filename = []
+        self.size = array('q')
+        self.duration = array('d')
+        self.speed = array('d')
+        self.timestamp_ns = array('q')
+        self.type = []
+        self.extend(records)
+    
+    def _columns(self):
+        return (self.url, self.filename, self.size, self.duration, self.speed, self.timestamp_ns, self.type)
+    
+    def add(self, url, filename, size, duration, speed, timestamp_ns, type=None):
+        # Convert everything before touching a column, so a bad value can't leave them different lengths
+        size, timestamp_ns = array('q', [int(size or 0)]), array('q', [timestamp_ns])
+        duration, speed = float(duration or 0), float(speed or 0)
+        self.url.append(url)
+        self.filename.append(filename)
+        self.size.extend(size)
+        self.duration.append(duration)
+        self.speed.append(speed)
+        self.timestamp_ns.extend(timestamp_ns)
+        self.type.append(type)
+    
+    def append(self, record):
+        self.add(record.get('url', ''), record.get('filename', 'Unknown'), record.get('size'),
+                 record.get('duration'), record.get('speed'), _record_ts(record), record.get('type'))
+    
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+    
+    def replace(self, records):
+        """Swap in records wholesale, building each column in one pass instead of appending row by row
+        
+        All columns are built before any is assigned, so a record that fails to convert leaves the
+        history as it was.
+        """
+        columns = (
+            [record.get('url', '') for record in records],
+            [record.get('filename', 'Unknown') for record in records],
+            array('q', [int(record.get('size') or 0) for record in records]),
+            array('d', [float(record.get('duration') or 0) for record in records]),
+            array('d', [float(record.get('speed') or 0) for record in records]),
+            array('q', [_record_ts(record) for record in records]),
+            [record.get('type') for record in records],
+        )
+        (self.url, self.filename, self.size, self.duration, self.speed,
+         self.timestamp_ns, self.type) = columns
+    
+    def __setitem__(self, index, records):
+        if index != slice(None):
+            raise TypeError("DownloadHistory only supports replacing the whole history (history[:] = records)")
+        self.replace(records)
+    
+    def clear(self):
+        for column in self._columns():
+            del column[:]
+    
+    def row(self, i):
+        record = {
+            'url': self.url[i],
+            'filename': self.filename[i],
+            'size': self.size[i],
+            'duration': self.duration[i],
+            'speed': self.speed[i],
+            'timestamp_ns': self.timestamp_ns[i]
+        }
+        if self.type[i] is not None:
+            record['type'] = self.type[i]
+        return record
+    
+    def __len__(self):
+        return len(self.url)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.row(i) for i in range(*index.indices(len(self)))]
+        return self.row(index)
+    
+    def __iter__(self):
+        return (self.row(i) for i in range(len(self)))
+    
+    def records(self):
+        """Return the history as a list of dicts (the export/import format)"""
+        return list(self)
+    
+    def total_size(self):
+        return sum(self.size)
+    
+    def average_speed(self):
+        return statistics.fmean(self.speed) if self.speed else 0.0
+
+DOWNLOAD_HISTORY = DownloadHistory()
+
+# Guards STATS and DOWNLOAD_HISTORY when batch downloads run in parallel
+_STATS_LOCK = threading.Lock()
+
+# Casefolded paths reserved by downloads in progress, so parallel jobs never pick the same file
+_CLAIMED_PATHS = set()
+_CLAIM_LOCK = threading.Lock()
+
+# Shared HTTP session, created on first use so connections are pooled across calls
+_SESSION = None
+
+def _adapter_settings(concurrent=None):
+    """The CONFIG values an HTTPAdapter is built from"""
+    # Per-host pool: every parallel batch job may run up to max_threads range workers on the session
+    pool_maxsize = CONFIG['max_threads'] * max(1, concurrent or CONFIG['concurrent_downloads'])
+    return (CONFIG['connection_pool_size'], pool_maxsize, CONFIG['retries'])
+
+def configure_session(session, concurrent=None):
+    """Apply pool, retry, proxy and User-Agent settings from CONFIG to a session
+    
+    concurrent overrides CONFIG['concurrent_downloads'] when sizing the pool, for batches run
+    with a different number of parallel downloads.
+    """
+    # Remount only when the pool or retry settings changed, closing the replaced adapters'
+    # pools rather than leaving their idle connections for GC
+    settings = _adapter_settings(concurrent)
+    if getattr(session, 'adapter_settings', None) != settings:
+        pool_connections, pool_maxsize, retries = settings
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(total=retries, backoff_factor=0.3)
+        )
+        replaced = {session.adapters.get(prefix) for prefix in ('http://', 'https://')}
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        for old in replaced:
+            if old is not None:
+                old.close()
+        session.adapter_settings = settings
+    session.proxies = dict(_PROXIES)
+    session.headers.update(_HEADERS)
+
+def get_session():
+    """Return the shared HTTP session, creating it on first use"""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = requests.Session()
+        configure_session(_SESSION)
+    return _SESSION
+
+def _rebuild_caches():
+    """Recompute values derived from CONFIG; call whenever CONFIG changes"""
+    global _PROXY_URL, _PROXIES, _HEADERS, _BLOCKED_EXT_RE, _ALLOWED_PROTO_SET, _RATE_LIMIT_BPS, _OUTTMPL
+    
+    _PROXY_URL = None
+    if CONFIG['proxy_enabled']:
+        _PROXY_URL = f"{CONFIG['proxy_type']}://"
+        if CONFIG['proxy_auth']:
+            _PROXY_URL += f"{CONFIG['proxy_username']}:{CONFIG['proxy_password']}@"
+        _PROXY_URL += f"{CONFIG['proxy_host']}:{CONFIG['proxy_port']}"
+    _PROXIES = {'http': _PROXY_URL, 'https': _PROXY_URL} if _PROXY_URL else {}
+    _HEADERS = {'User-Agent': CONFIG['user_agent']}
+    # One alternation anchored at the end of the path instead of an endswith() per extension
+    _BLOCKED_EXT_RE = None
+    if CONFIG['blocked_extensions']:
+        _BLOCKED_EXT_RE = re.compile('(?:' + '|'.join(map(re.escape, CONFIG['blocked_extensions'])) + ')$', re.IGNORECASE)
+    _ALLOWED_PROTO_SET = frozenset(CONFIG['allowed_protocols'])
+    _RATE_LIMIT_BPS = CONFIG['download_rate_limit_kbps'] * 1024
+    # yt-dlp output template; imported or hand-edited configs may still hold a ~ path
+    _OUTTMPL = os.path.join(os.path.expanduser(CONFIG['download_dir']), '%(title)s.%(ext)s')
+    
+    if _SESSION is not None:
+        configure_session(_SESSION)
+
+_rebuild_caches()
+
+def _parse_bool(value):
+    return value.lower() in ('true', '1', 'yes', 'on')
+
+def _parse_list(value):
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+def _clamp(value, lo, hi):
+    """Limit value to [lo, hi] with plain comparisons instead of nested min()/max() calls"""
+    return lo if value < lo else hi if value > hi else value
+
+def _parse_int(value, lo=None, hi=None, default=None):
+    """Parse a user-entered integer and clamp it to [lo, hi]; returns default if it isn't a number"""
+    try:
+        result = int(value)
+    except (ValueError, TypeError):
+        return default
+    if lo is not None and result < lo:
+        return lo
+    if hi is not None and result > hi:
+        return hi
+    return result
+
+# INI string -> CONFIG value converters, picked once from the default value types
+_CONFIG_CONVERTERS = {
+    key: (_parse_bool if isinstance(value, bool) else
+          int if isinstance(value, int) else
+          _parse_list if isinstance(value, list) else
+          str)
+    for key, value in DEFAULT_CONFIG.items()
+}
+
+# mtime of the config file CONFIG was last loaded from or saved to
+_CONFIG_MTIME = None
+# Set when the settings menus change CONFIG; the file is written once on leaving them
+_CONFIG_DIRTY = False
+# True while HISTORY_FILE holds exactly DOWNLOAD_HISTORY as written by save_history()
+_HISTORY_SYNCED = False
+# Set when a download is added to DOWNLOAD_HISTORY; the file is written by flush_history()
+_HISTORY_DIRTY = False
 
 def load_config():
-    """Load configuration from file"""
-    global CONFIG
-    if os.path.exists(CONFIG_FILE):
+    """Load configuration from file, skipping the parse if it hasn't changed"""
+    global _CONFIG_MTIME
+    try:
+        mtime = os.stat(CONFIG_FILE).st_mtime_ns
+    except OSError:
+        mtime = None
+    
+    if mtime is not None and mtime == _CONFIG_MTIME:
+        return
+    
+    if mtime is not None:
         try:
             config_parser = configparser.ConfigParser()
             config_parser.read(CONFIG_FILE)
             
             if 'XTERNAL' in config_parser:
                 section = config_parser['XTERNAL']
-                for key in CONFIG:
+                for key, convert in _CONFIG_CONVERTERS.items():
                     if key in section:
-                        value = section[key]
-                        # Convert types appropriately
-                        if isinstance(CONFIG[key], bool):
-                            CONFIG[key] = value.lower() in ('true', '1', 'yes', 'on')
-                        elif isinstance(CONFIG[key], int):
-                            CONFIG[key] = int(value)
-                        elif isinstance(CONFIG[key], list):
-                            CONFIG[key] = [item.strip() for item in value.split(',') if item.strip()]
-                        else:
-                            CONFIG[key] = value
+                        CONFIG[key] = convert(section[key])
+            _CONFIG_MTIME = mtime
         except Exception as e:
             print(f"{Colors.WARNING}Warning: Failed to load config: {e}{Colors.END}")
+    
+    _rebuild_caches()
+
+def _iter_history_json():
+    """Yield DOWNLOAD_HISTORY as indented JSON text, encoding one row dict at a time
+    
+    The output matches _json_dumps(DOWNLOAD_HISTORY.records(), indent=True), without building
+    either the list of row dicts or the whole string.
+    """
+    encode = json.JSONEncoder(indent=2, ensure_ascii=not ORJSON_AVAILABLE).encode
+    separator = '[\n  '
+    for record in DOWNLOAD_HISTORY:
+        yield separator
+        # Newlines inside strings are escaped, so every raw newline is layout and can be re-indented
+        yield encode(record).replace('\n', '\n  ')
+        separator = ',\n  '
+    yield '\n]' if DOWNLOAD_HISTORY else '[]'
+
+def write_history_json(path):
+    """Write DOWNLOAD_HISTORY to path as indented JSON, streaming large histories"""
+    if len(DOWNLOAD_HISTORY) > HISTORY_STREAM_EXPORT:
+        with open(path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(_iter_history_json())
+    else:
+        Path(path).write_bytes(_json_dumps(DOWNLOAD_HISTORY.records(), indent=True))
+
+def load_history():
+    """Load persisted download history"""
+    if os.path.exists(HISTORY_FILE):
+        try:
+            DOWNLOAD_HISTORY[:] = _load_json_file(HISTORY_FILE)
+        except Exception as e:
+            print(f"{Colors.WARNING}Warning: Failed to load history: {e}{Colors.END}")
+
+def save_history():
+    """Persist download history (via a temp file and rename, so a crash can't truncate it)"""
+    global _HISTORY_SYNCED, _HISTORY_DIRTY
+    _HISTORY_SYNCED = False
+    try:
+        tmp_path = HISTORY_FILE + '.tmp'
+        # Same format as an export, so exports can copy this file as-is
+        write_history_json(tmp_path)
+        os.replace(tmp_path, HISTORY_FILE)
+        _HISTORY_SYNCED = True
+        _HISTORY_DIRTY = False
+        return True
+    except Exception as e:
+        print(f"{Colors.ERROR}Error saving history: {e}{Colors.END}")
+        return False
+
+def mark_history_dirty():
+    """Note an in-memory history change; cheap enough to call under _STATS_LOCK"""
+    global _HISTORY_SYNCED, _HISTORY_DIRTY
+    _HISTORY_SYNCED = False
+    _HISTORY_DIRTY = True
+
+def flush_history():
+    """Write the history file if downloads were added since the last save"""
+    if _HISTORY_DIRTY:
+        save_history()
+
+def copy_file(src, dst):
+    """Copy src to dst in the kernel with sendfile, falling back to 1 MiB buffered copies"""
+    # Opening dst for writing first would truncate src if they are the same file
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        try:
+            size = os.fstat(fsrc.fileno()).st_size
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+            return
+        except (AttributeError, OSError):
+            # No sendfile on this platform/filesystem; restart with a plain copy
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+        shutil.copyfileobj(fsrc, fdst, length=1 << 20)
+
+def mark_config_dirty():
+    """Apply an in-memory CONFIG change now and defer writing it to flush_config()"""
+    global _CONFIG_DIRTY
+    _CONFIG_DIRTY = True
+    _rebuild_caches()
+
+def flush_config():
+    """Write CONFIG if the settings menus changed it"""
+    if _CONFIG_DIRTY:
+        save_config()
 
 def save_config():
-    """Save configuration to file"""
+    """Save configuration to file (atomically, via a temp file and rename)"""
+    global _CONFIG_MTIME, _CONFIG_DIRTY
     try:
         config_parser = configparser.ConfigParser()
         config_parser['XTERNAL'] = {}
@@ -196,8 +631,16 @@ def save_config():
                 section[key] = str(value)
         
         os.makedirs(os.path.dirname(CONFIG_FILE), exist_ok=True)
-        with open(CONFIG_FILE, 'w') as f:
+        tmp_path = CONFIG_FILE + '.tmp'
+        with open(tmp_path, 'w') as f:
             config_parser.write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, CONFIG_FILE)
+        _CONFIG_MTIME = os.stat(CONFIG_FILE).st_mtime_ns
+        _CONFIG_DIRTY = False
+        
+        _rebuild_caches()
         
         return True
     except Exception as e:
@@ -246,72 +689,94 @@ def loading_animation(text, duration=2, style="dots"):
     
     print(f"\r{Colors.SUCCESS}✓ {text} Complete{Colors.END}")
 
+# Free space only needs to be roughly current, so batches stat each download dir at most once per window
+DISK_SPACE_TTL = 5
+
+@functools.lru_cache(maxsize=8)
+def _disk_free(path, window):
+    """Free bytes at path; window is the monotonic-time slot the cached value belongs to"""
+    return shutil.disk_usage(path).free
+
 def check_disk_space(path, required_mb):
     """Check available disk space"""
     try:
-        import shutil
-        total, used, free = shutil.disk_usage(path)
+        free = _disk_free(os.path.realpath(path), int(time.monotonic()) // DISK_SPACE_TTL)
         free_mb = free / (1024 * 1024)
         return free_mb >= required_mb, free_mb
     except:
         return True, 0  # Assume OK if can't check
 
+@functools.lru_cache(maxsize=1)
+def _static_system_info():
+    """System facts that cannot change while the process runs"""
+    info = {
+        'os': f"{platform.system()} {platform.release()}",
+        'python': platform.python_version(),
+        'cpu_cores': os.cpu_count()
+    }
+    if PSUTIL_AVAILABLE:
+        info['memory_total'] = f"{psutil.virtual_memory().total / 1024**3:.1f} GB"
+    return info
+
+# The resources menu re-reads free disk space at most this often
+SYSTEM_SNAPSHOT_TTL = 60
+
+@functools.lru_cache(maxsize=1)
+def _system_snapshot(window):
+    """(cpu_count, memory_gb, disk_free_gb) for the given monotonic-time slot; the last two are None without psutil"""
+    if not PSUTIL_AVAILABLE:
+        return os.cpu_count() or 4, None, None
+    return psutil.cpu_count(), psutil.virtual_memory().total / (1024**3), psutil.disk_usage('.').free / (1024**3)
+
 def get_system_info():
-    try:
-        import platform
-        try:
-            import psutil
-            
-            info = {
-                'os': f"{platform.system()} {platform.release()}",
-                'python': platform.python_version(),
-                'cpu_cores': os.cpu_count(),
-                'memory_total': f"{psutil.virtual_memory().total / 1024**3:.1f} GB",
-                'memory_available': f"{psutil.virtual_memory().available / 1024**3:.1f} GB",
-                'disk_space': f"{psutil.disk_usage('.').free / 1024**3:.1f} GB free"
-            }
-        except ImportError:
-            info = {
-                'os': f"{platform.system()} {platform.release()}",
-                'python': platform.python_version(),
-                'cpu_cores': os.cpu_count(),
-                'note': 'Install psutil for detailed system info'
-            }
-        return info
-    except ImportError:
-        return {'error': 'platform module not available'}
+    info = dict(_static_system_info())
+    if PSUTIL_AVAILABLE:
+        info['memory_available'] = f"{psutil.virtual_memory().available / 1024**3:.1f} GB"
+        info['disk_space'] = f"{psutil.disk_usage('.').free / 1024**3:.1f} GB free"
+    else:
+        info['note'] = 'Install psutil for detailed system info'
+    return info
 
-def check_network_advanced():
+_VPN_INDICATORS = frozenset(('vpn', 'proxy', 'tor', 'tunnel', 'anonymous'))
+_SUSPICIOUS_DOMAINS = frozenset(('localhost', '127.0.0.1', '0.0.0.0'))
+
+async def _probe_dns():
     results = {}
-    
+    loop = asyncio.get_running_loop()
     try:
         start = time.time()
-        socket.gethostbyname('google.com')
+        await loop.getaddrinfo('google.com', None)
         results['dns_response'] = f"{(time.time() - start) * 1000:.1f}ms"
     except:
         results['dns_response'] = "Failed"
-    
+    return results
+
+async def _probe_ip_and_geo():
+    results = {}
+    # The geo lookup needs the public IP, so these two stay sequential
     try:
-        ip_response = requests.get("https://api.ipify.org", timeout=5)
+        ip_response = await asyncio.to_thread(requests.get, "https://api.ipify.org", timeout=5)
         results['public_ip'] = ip_response.text
         
-        geo_response = requests.get(f"https://ipinfo.io/{results['public_ip']}/json", timeout=5)
+        geo_response = await asyncio.to_thread(requests.get, f"https://ipinfo.io/{results['public_ip']}/json", timeout=5)
         geo_data = geo_response.json()
         
         results['location'] = f"{geo_data.get('city', 'Unknown')}, {geo_data.get('country', 'Unknown')}"
         results['isp'] = geo_data.get('org', 'Unknown')
         results['timezone'] = geo_data.get('timezone', 'Unknown')
         
-        vpn_indicators = ['vpn', 'proxy', 'tor', 'tunnel', 'anonymous']
         org_lower = geo_data.get('org', '').lower()
-        results['vpn_detected'] = any(indicator in org_lower for indicator in vpn_indicators)
+        results['vpn_detected'] = any(indicator in org_lower for indicator in _VPN_INDICATORS)
         
     except Exception as e:
         results['error'] = str(e)
-    
+    return results
+
+async def _probe_speed():
+    results = {}
     try:
         start_time = time.time()
-        test_response = requests.get("https://httpbin.org/bytes/1048576", timeout=15)
+        await asyncio.to_thread(requests.get, "https://httpbin.org/bytes/1048576", timeout=15)
         end_time = time.time()
         
         duration = end_time - start_time
@@ -320,27 +785,36 @@ def check_network_advanced():
         
     except:
         results['download_speed'] = "Test failed"
-    
     return results
 
-def validate_url(url):
+async def _probe_all():
+    results = {}
+    # gather() returns in argument order, so the report order stays fixed
+    for partial in await asyncio.gather(_probe_dns(), _probe_ip_and_geo(), _probe_speed()):
+        results.update(partial)
+    return results
+
+def check_network_advanced():
+    """Run the DNS, IP/geo and speed probes concurrently"""
+    return asyncio.run(_probe_all())
+
+def validate_url(url, parsed=None):
     try:
-        parsed = urllib.parse.urlparse(url)
+        if parsed is None:
+            parsed = urllib.parse.urlparse(url)
         
-        if parsed.scheme not in CONFIG['allowed_protocols']:
+        if parsed.scheme not in _ALLOWED_PROTO_SET:
             return False, f"Protocol '{parsed.scheme}' not allowed"
         
         if not parsed.netloc:
             return False, "Invalid hostname"
         
-        suspicious_domains = ['localhost', '127.0.0.1', '0.0.0.0']
-        if parsed.netloc.lower() in suspicious_domains and not url.startswith('http://localhost'):
+        if parsed.netloc.lower() in _SUSPICIOUS_DOMAINS and not url.startswith('http://localhost'):
             return False, "Suspicious domain detected"
         
-        path = parsed.path.lower()
-        blocked_ext = [ext for ext in CONFIG['blocked_extensions'] if path.endswith(ext)]
-        if blocked_ext:
-            return False, f"Blocked file type: {blocked_ext[0]}"
+        blocked = _BLOCKED_EXT_RE.search(parsed.path) if _BLOCKED_EXT_RE else None
+        if blocked:
+            return False, f"Blocked file type: {blocked.group().lower()}"
         
         return True, "Valid URL"
         
@@ -348,28 +822,25 @@ def validate_url(url):
         return False, f"URL validation error: {str(e)}"
 
 def calculate_file_hash(filepath, algorithm='sha256'):
-    hash_algo = hashlib.new(algorithm)
     try:
         with open(filepath, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_algo.update(chunk)
-        return hash_algo.hexdigest()
+            return hashlib.file_digest(f, algorithm).hexdigest()
     except Exception as e:
+        print(f"{Colors.WARNING}⚠ Could not hash {filepath}: {e}{Colors.END}")
         return None
 
-def get_file_info_advanced(url):
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+def format_size(size_bytes):
+    """Format a byte count using the largest binary unit that keeps it >= 1"""
+    if size_bytes <= 0:
+        return "Unknown"
+    unit_idx = min(len(_UNITS) - 1, (size_bytes.bit_length() - 1) // 10)
+    return f"{size_bytes / (1 << (10 * unit_idx)):.1f} {_UNITS[unit_idx]}"
+
+def get_file_info_advanced(url, parsed=None):
     try:
-        session = requests.Session()
-        
-        if CONFIG['proxy_enabled']:
-            proxy_url = f"{CONFIG['proxy_type']}://"
-            if CONFIG['proxy_auth']:
-                proxy_url += f"{CONFIG['proxy_username']}:{CONFIG['proxy_password']}@"
-            proxy_url += f"{CONFIG['proxy_host']}:{CONFIG['proxy_port']}"
-            session.proxies = {'http': proxy_url, 'https': proxy_url}
-        
-        session.headers.update({'User-Agent': CONFIG['user_agent']})
-        
+        session = get_session()
         response = session.head(url, timeout=CONFIG['timeout'], verify=CONFIG['verify_ssl'])
         
         info = {
@@ -379,34 +850,27 @@ def get_file_info_advanced(url):
             'last_modified': response.headers.get('last-modified', 'unknown'),
             'server': response.headers.get('server', 'unknown'),
             'supports_resume': 'accept-ranges' in response.headers,
-            'filename': extract_filename(url, response.headers),
+            'filename': extract_filename(url, response.headers, parsed),
             'headers': dict(response.headers)
         }
         
-        size_bytes = info['file_size']
-        if size_bytes > 0:
-            for unit in ['B', 'KB', 'MB', 'GB']:
-                if size_bytes < 1024:
-                    info['file_size_formatted'] = f"{size_bytes:.1f} {unit}"
-                    break
-                size_bytes /= 1024
-        else:
-            info['file_size_formatted'] = "Unknown"
+        info['file_size_formatted'] = format_size(info['file_size'])
         
         return info, None
         
     except Exception as e:
         return None, str(e)
 
-def extract_filename(url, headers):
+def extract_filename(url, headers, parsed=None):
     if 'content-disposition' in headers:
         disposition = headers['content-disposition']
         if 'filename=' in disposition:
             filename = disposition.split('filename=')[1].strip('"').strip("'")
             return urllib.parse.unquote(filename)
     
-    parsed_url = urllib.parse.urlparse(url)
-    filename = os.path.basename(parsed_url.path)
+    if parsed is None:
+        parsed = urllib.parse.urlparse(url)
+    filename = os.path.basename(parsed.path)
     
     if filename:
         return urllib.parse.unquote(filename)
@@ -414,14 +878,69 @@ def extract_filename(url, headers):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     return f"download_{timestamp}"
 
-def professional_download(url, custom_filename=None, show_progress=True):
-    is_valid, validation_msg = validate_url(url)
-    if not is_valid:
-        print(f"{Colors.ERROR}✗ URL Validation Failed: {validation_msg}{Colors.END}")
+@dataclass
+class PlanResult:
+    """Outcome of validating and probing a URL before download"""
+    parsed: urllib.parse.ParseResult
+    valid: bool
+    reason: str
+    filename: Optional[str] = None
+    file_info: Optional[dict] = None
+    error: Optional[str] = None
+
+def probe_and_plan(url):
+    """Validate url and HEAD it, parsing the URL only once"""
+    parsed = urllib.parse.urlparse(url)
+    valid, reason = validate_url(url, parsed)
+    if not valid:
+        return PlanResult(parsed, valid, reason)
+    
+    file_info, error = get_file_info_advanced(url, parsed)
+    filename = file_info['filename'] if file_info else None
+    return PlanResult(parsed, valid, reason, filename, file_info, error)
+
+def claim_download_path(filename, rename, resumable=False):
+    """Reserve a path in the download dir for filename until release_download_path(); (filename, filepath)
+    
+    With rename, a name that exists on disk (unless resumable) or is held by another job is replaced by
+    the first free name_N variant. Returns (None, None) if the name is held and rename is off.
+    """
+    directory = CONFIG['download_dir']
+    filepath = os.path.join(directory, filename)
+    with _CLAIM_LOCK:
+        in_use = filepath.casefold() in _CLAIMED_PATHS
+        if in_use and not rename:
+            return None, None
+        if in_use or (rename and not resumable and os.path.exists(filepath)):
+            # One directory listing instead of a stat per candidate name; casefolded to match
+            # case-insensitive filesystems, with the final pick confirmed by os.path.exists
+            with os.scandir(directory) as entries:
+                existing = {entry.name.casefold() for entry in entries}
+            base, ext = os.path.splitext(filename)
+            counter = 1
+            while (filename.casefold() in existing or os.path.join(directory, filename).casefold() in _CLAIMED_PATHS
+                   or os.path.exists(os.path.join(directory, filename))):
+                filename = f"{base}_{counter}{ext}"
+                counter += 1
+            filepath = os.path.join(directory, filename)
+        _CLAIMED_PATHS.add(filepath.casefold())
+    return filename, filepath
+
+def release_download_path(filepath):
+    with _CLAIM_LOCK:
+        _CLAIMED_PATHS.discard(filepath.casefold())
+
+def professional_download(url, custom_filename=None, show_progress=True, plan=None, interactive=True):
+    if plan is None:
+        if interactive:
+            loading_animation("Analyzing download target")
+        plan = probe_and_plan(url)
+    
+    if not plan.valid:
+        print(f"{Colors.ERROR}✗ URL Validation Failed: {plan.reason}{Colors.END}")
         return False
     
-    loading_animation("Analyzing download target")
-    file_info, error = get_file_info_advanced(url)
+    file_info, error = plan.file_info, plan.error
     
     if error:
         print(f"{Colors.ERROR}✗ Failed to get file info: {error}{Colors.END}")
@@ -438,69 +957,77 @@ def professional_download(url, custom_filename=None, show_progress=True):
             print(f"{Colors.ERROR}✗ Insufficient disk space: {free_mb:.1f}MB free, {required_mb:.1f}MB required{Colors.END}")
             return False
     
-    if CONFIG['auto_rename'] and os.path.exists(filepath):
-        base, ext = os.path.splitext(filename)
-        counter = 1
-        while os.path.exists(filepath):
-            new_filename = f"{base}_{counter}{ext}"
-            filepath = os.path.join(CONFIG['download_dir'], new_filename)
-            counter += 1
-        filename = os.path.basename(filepath)
-    
     os.makedirs(CONFIG['download_dir'], exist_ok=True)
     
-    print(f"\n{Colors.INFO}╭─ Download Information{Colors.END}")
-    print(f"{Colors.INFO}├─{Colors.END} {Colors.WHITE}Filename:{Colors.END} {filename}")
-    print(f"{Colors.INFO}├─{Colors.END} {Colors.WHITE}Size:{Colors.END} {file_info['file_size_formatted']}")
-    print(f"{Colors.INFO}├─{Colors.END} {Colors.WHITE}Type:{Colors.END} {file_info['content_type']}")
-    print(f"{Colors.INFO}├─{Colors.END} {Colors.WHITE}Server:{Colors.END} {file_info['server']}")
-    print(f"{Colors.INFO}├─{Colors.END} {Colors.WHITE}Resume Support:{Colors.END} {'Yes' if file_info['supports_resume'] else 'No'}")
-    threads_text = CONFIG['max_threads'] if file_info['file_size'] > 10*1024*1024 else 1
-    print(f"{Colors.INFO}╰─{Colors.END} {Colors.WHITE}Threads:{Colors.END} {threads_text}")
-    
-    confirm = input(f"\n{Colors.ACCENT}Continue download? (Y/n): {Colors.END}").lower()
-    if confirm == 'n':
+    # A partial ranged download is resumed in place rather than renamed around
+    resumable = CONFIG['resume_downloads'] and os.path.exists(range_state_path(filepath))
+    # Chosen and reserved in one step; parallel batch jobs would otherwise both see a name as free
+    claimed_name, filepath = claim_download_path(filename, CONFIG['auto_rename'], resumable)
+    if filepath is None:
+        print(f"{Colors.ERROR}✗ {filename} is already being downloaded by another job{Colors.END}")
+        with _STATS_LOCK:
+            STATS['failed_downloads'] += 1
         return False
+    filename = claimed_name
+    
+    # Parallel batch jobs skip the summary and prompt so output doesn't interleave
+    if interactive:
+        print(f"\n{Colors.INFO}╭─ Download Information{Colors.END}")
+        print(f"{INFO_L} {Colors.WHITE}Filename:{Colors.END} {filename}")
+        print(f"{INFO_L} {Colors.WHITE}Size:{Colors.END} {file_info['file_size_formatted']}")
+        print(f"{INFO_L} {Colors.WHITE}Type:{Colors.END} {file_info['content_type']}")
+        print(f"{INFO_L} {Colors.WHITE}Server:{Colors.END} {file_info['server']}")
+        print(f"{INFO_L} {Colors.WHITE}Resume Support:{Colors.END} {'Yes' if file_info['supports_resume'] else 'No'}")
+        threads_text = len(split_ranges(file_info['file_size'])) if file_info['file_size'] > 10*1024*1024 else 1
+        print(f"{INFO_E} {Colors.WHITE}Threads:{Colors.END} {threads_text}")
+        
+        confirm = input(f"\n{Colors.ACCENT}Continue download? (Y/n): {Colors.END}")[:1]
+        if confirm in _NO:
+            release_download_path(filepath)
+            return False
     
     start_time = time.time()
     success = False
+    verify_hash = CONFIG['hash_verification'] and file_info['file_size'] < 100 * 1024 * 1024
+    hasher = None
     
     try:
         if file_info['file_size'] > 10 * 1024 * 1024 and file_info['supports_resume']:
+            # Ranges land out of order, so this path hashes the finished file instead
             success = threaded_download_advanced(url, filepath, file_info, show_progress)
         else:
-            success = simple_download_advanced(url, filepath, file_info, show_progress)
+            hasher = hashlib.sha256() if verify_hash else None
+            success = simple_download_advanced(url, filepath, file_info, show_progress, hasher)
         
         if success:
             end_time = time.time()
             duration = end_time - start_time
             avg_speed = (file_info['file_size'] / 1024 / 1024) / duration if duration > 0 else 0
             
-            STATS['total_downloads'] += 1
-            STATS['total_bytes'] += file_info['file_size']
-            STATS['average_speed'] = (STATS['average_speed'] + avg_speed) / 2
-            
-            if CONFIG['download_history']:
-                DOWNLOAD_HISTORY.append({
-                    'url': url,
-                    'filename': filename,
-                    'size': file_info['file_size'],
-                    'duration': duration,
-                    'speed': avg_speed,
-                    'timestamp': datetime.now().isoformat()
-                })
+            with _STATS_LOCK:
+                STATS['total_downloads'] += 1
+                STATS['total_bytes'] += file_info['file_size']
+                STATS['average_speed'] = (STATS['average_speed'] + avg_speed) / 2
+                
+                if CONFIG['download_history']:
+                    DOWNLOAD_HISTORY.add(url, filename, file_info['file_size'], duration, avg_speed,
+                                         time.time_ns())
+                    mark_history_dirty()
             
-            if CONFIG['hash_verification'] and file_info['file_size'] < 100 * 1024 * 1024:
-                print(f"{Colors.INFO}▶ Verifying file integrity...{Colors.END}")
-                file_hash = calculate_file_hash(filepath)
+            if verify_hash:
+                if interactive:
+                    print(f"{Colors.INFO}▶ Verifying file integrity...{Colors.END}")
+                file_hash = hasher.hexdigest() if hasher else calculate_file_hash(filepath)
                 if file_hash:
-                    print(f"{Colors.SUCCESS}✓ SHA256: {file_hash[:16]}...{Colors.END}")
+                    suffix = "" if interactive else f" ({filename})"
+                    print(f"{Colors.SUCCESS}✓ SHA256: {file_hash[:16]}...{suffix}{Colors.END}")
             
-            print(f"\n{Colors.SUCCESS}╭─ Download Complete{Colors.END}")
-            print(f"{Colors.SUCCESS}├─{Colors.END} {Colors.WHITE}File:{Colors.END} {filename}")
-            print(f"{Colors.SUCCESS}├─{Colors.END} {Colors.WHITE}Time:{Colors.END} {duration:.1f}s")
-            print(f"{Colors.SUCCESS}├─{Colors.END} {Colors.WHITE}Speed:{Colors.END} {avg_speed:.1f} MB/s")
-            print(f"{Colors.SUCCESS}╰─{Colors.END} {Colors.WHITE}Location:{Colors.END} {filepath}")
+            if interactive:
+                print(f"\n{Colors.SUCCESS}╭─ Download Complete{Colors.END}")
+                print(f"{Colors.SUCCESS}├─{Colors.END} {Colors.WHITE}File:{Colors.END} {filename}")
+                print(f"{Colors.SUCCESS}├─{Colors.END} {Colors.WHITE}Time:{Colors.END} {duration:.1f}s")
+                print(f"{Colors.SUCCESS}├─{Colors.END} {Colors.WHITE}Speed:{Colors.END} {avg_speed:.1f} MB/s")
+                print(f"{Colors.SUCCESS}╰─{Colors.END} {Colors.WHITE}Location:{Colors.END} {filepath}")
             
             return True
             
@@ -509,27 +1036,50 @@ def professional_download(url, custom_filename=None, show_progress=True):
         return False
     except Exception as e:
         print(f"{Colors.ERROR}✗ Download failed: {str(e)}{Colors.END}")
-        STATS['failed_downloads'] += 1
+        with _STATS_LOCK:
+            STATS['failed_downloads'] += 1
         return False
+    finally:
+        release_download_path(filepath)
+
+class _CountingWriter:
+    """File wrapper for shutil.copyfileobj that counts, optionally hashes, and reports each write"""
+    
+    def __init__(self, f, count=0, callback=None, hasher=None):
+        self.f = f
+        self.count = count
+        self.callback = callback
+        self.hasher = hasher
+    
+    def write(self, data):
+        self.f.write(data)
+        if self.hasher is not None:
+            self.hasher.update(data)
+        self.count += len(data)
+        if self.callback:
+            self.callback(len(data), self.count)
+        return len(data)
 
-def simple_download_advanced(url, filepath, file_info, show_progress=True):
+def simple_download_advanced(url, filepath, file_info, show_progress=True, hasher=None):
     resume_pos = 0
-    if os.path.exists(filepath) and CONFIG['resume_downloads']:
+    if os.path.exists(range_state_path(filepath)):
+        # A preallocated partial ranged download: its size says nothing about what is on disk,
+        # and this path can only append, so start the file over
+        discard_range_state(filepath)
+    elif os.path.exists(filepath) and CONFIG['resume_downloads']:
         resume_pos = os.path.getsize(filepath)
+        if hasher is not None and resume_pos > 0:
+            # Seed the running hash with the bytes already on disk
+            with open(filepath, 'rb') as f:
+                for block in iter(functools.partial(f.read, 1024 * 1024), b''):
+                    hasher.update(block)
         if resume_pos == file_info['file_size']:
             print(f"{Colors.SUCCESS}✓ File already complete{Colors.END}")
             return True
     
-    session = requests.Session()
-    
-    if CONFIG['proxy_enabled']:
-        proxy_url = f"{CONFIG['proxy_type']}://"
-        if CONFIG['proxy_auth']:
-            proxy_url += f"{CONFIG['proxy_username']}:{CONFIG['proxy_password']}@"
-        proxy_url += f"{CONFIG['proxy_host']}:{CONFIG['proxy_port']}"
-        session.proxies = {'http': proxy_url, 'https': proxy_url}
+    session = get_session()
     
-    headers = {'User-Agent': CONFIG['user_agent']}
+    headers = {}
     if resume_pos > 0:
         headers['Range'] = f'bytes={resume_pos}-'
     
@@ -539,144 +1089,403 @@ def simple_download_advanced(url, filepath, file_info, show_progress=True):
     response.raise_for_status()
     
     total_size = file_info['file_size']
-    downloaded = resume_pos
-    last_time = time.time()
-    
+    tokens = 0
+    last_refill = time.monotonic_ns()
+    last_draw = 0.0
+    
+    def draw_progress(downloaded):
+        progress = (downloaded / total_size) * 100
+        bar = _BARS_40_SHADE[min(40, int(40 * progress / 100))]
+        speed = downloaded / (time.time() - STATS['session_start']) * _MIB
+        
+        progress_line = f"[{bar}] {progress:.1f}% "
+        progress_line += f"({downloaded >> 20}MB/{total_size >> 20}MB) "
+        progress_line += f"{speed:.1f}MB/s"
+        sys.stdout.write(f"\r{Colors.PRIMARY}{progress_line}{Colors.END}")
+        sys.stdout.flush()
+    
+    # Runs once per chunk; globals it needs are bound as defaults so lookups are local
+    def on_write(length, downloaded, rate=_RATE_LIMIT_BPS, draw=show_progress and total_size > 0,
+                 monotonic=time.monotonic, monotonic_ns=time.monotonic_ns, interval=PROGRESS_INTERVAL):
+        nonlocal tokens, last_refill, last_draw
+        
+        # Rate limiting: token bucket refilled at rate bytes/s, holding at most one second of burst
+        if rate:
+            now = monotonic_ns()
+            tokens = min(tokens + (now - last_refill) * rate // 1_000_000_000, rate)
+            last_refill = now
+            tokens -= length
+            if tokens < 0:
+                time.sleep(-tokens / rate)
+        
+        # Redraw at most every PROGRESS_INTERVAL seconds rather than on every chunk
+        if draw:
+            now = monotonic()
+            if now - last_draw >= interval:
+                last_draw = now
+                draw_progress(downloaded)
+    
+    # Copy straight from the raw socket stream, skipping iter_content's per-chunk generator
+    response.raw.decode_content = True
     with open(filepath, mode) as f:
-        for chunk in response.iter_content(chunk_size=CONFIG['chunk_size']):
-            if chunk:
-                f.write(chunk)
-                downloaded += len(chunk)
-                
-                # Rate limiting
-                if CONFIG['download_rate_limit_kbps'] > 0:
-                    current_time = time.time()
-                    elapsed = current_time - last_time
-                    expected_time = len(chunk) / (CONFIG['download_rate_limit_kbps'] * 1024)
-                    if elapsed < expected_time:
-                        time.sleep(expected_time - elapsed)
-                    last_time = current_time
-                
-                if show_progress and total_size > 0:
-                    progress = (downloaded / total_size) * 100
-                    bar_length = 40
-                    filled = int(bar_length * progress / 100)
-                    bar = '█' * filled + '▒' * (bar_length - filled)
-                    speed = downloaded / (time.time() - STATS['session_start']) / 1024 / 1024
-                    
-                    progress_line = f"[{bar}] {progress:.1f}% "
-                    progress_line += f"({downloaded//1024//1024}MB/{total_size//1024//1024}MB) "
-                    progress_line += f"{speed:.1f}MB/s"
-                    print(f"\r{Colors.PRIMARY}{progress_line}{Colors.END}", end="", flush=True)
+        writer = _CountingWriter(f, resume_pos, on_write, hasher)
+        shutil.copyfileobj(response.raw, writer, CONFIG['chunk_size'])
     
     if show_progress:
+        if total_size > 0:
+            draw_progress(writer.count)
         print()
     
     return True
 
-def threaded_download_advanced(url, filepath, file_info, show_progress=True):
-    num_threads = min(CONFIG['max_threads'], 16)
-    file_size = file_info['file_size']
-    chunk_size = file_size // num_threads
+def open_output_file(filepath, size, truncate=True):
+    """Open filepath for positioned writes, preallocated to size bytes; truncate=False keeps a partial download"""
+    flags = os.O_WRONLY | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+    if not truncate:
+        return os.open(filepath, flags, 0o644)
+    fd = os.open(filepath, flags | os.O_TRUNC, 0o644)
+    try:
+        if hasattr(os, 'posix_fallocate'):
+            os.posix_fallocate(fd, 0, size)
+        else:
+            os.ftruncate(fd, size)
+    except OSError:
+        # Filesystem does not support fallocate
+        os.ftruncate(fd, size)
+    return fd
+
+if hasattr(os, 'pwrite'):
+    def pwrite_all(fd, data, offset):
+        """Write all of data at offset without touching the file position"""
+        view = memoryview(data)
+        while view:
+            written = os.pwrite(fd, view, offset)
+            view = view[written:]
+            offset += written
+else:
+    _PWRITE_LOCK = threading.Lock()
+
+    def pwrite_all(fd, data, offset):
+        """Write all of data at offset (seek + write fallback for Windows)"""
+        with _PWRITE_LOCK:
+            os.lseek(fd, offset, os.SEEK_SET)
+            os.write(fd, data)
+
+# Max buffers handed to a single pwritev call (well under IOV_MAX)
+_WRITE_BATCH = 64
+
+def pwritev_all(fd, buffers, offset):
+    """Write a list of buffers back to back at offset, in one syscall where possible"""
+    if len(buffers) > 1 and hasattr(os, 'pwritev'):
+        written = os.pwritev(fd, buffers, offset)
+        total = sum(len(b) for b in buffers)
+        if written == total:
+            return
+        pwrite_all(fd, b''.join(buffers)[written:], offset + written)
+    else:
+        pwrite_all(fd, b''.join(buffers), offset)
+
+class _RangeWriter:
+    """Sequential positioned writer that coalesces small writes into batched pwritev calls"""
+    
+    def __init__(self, fd, offset, callback=None, batch_size=0):
+        self.fd = fd
+        self.offset = offset
+        self.callback = callback
+        self.batch_size = batch_size
+        self.pending = []
+        self.pending_size = 0
+    
+    def write(self, data):
+        self.pending.append(data)
+        self.pending_size += len(data)
+        if self.pending_size >= self.batch_size or len(self.pending) >= _WRITE_BATCH:
+            self.flush()
+        if self.callback:
+            self.callback(len(data), self.offset + self.pending_size)
+        return len(data)
+    
+    def flush(self):
+        if self.pending:
+            pwritev_all(self.fd, self.pending, self.offset)
+            self.offset += self.pending_size
+            self.pending = []
+            self.pending_size = 0
+
+def print_range_progress(total_downloaded, file_size, start_time, resumed=0):
+    progress = (total_downloaded / file_size) * 100 if file_size > 0 else 0
+    elapsed = time.time() - start_time
+    speed = (total_downloaded - resumed) / elapsed * _MIB if elapsed > 0 else 0
+    
+    bar = _BARS_50[min(50, int(50 * progress / 100))]
+    
+    progress_line = f"[{bar}] {progress:.1f}% "
+    progress_line += f"({total_downloaded >> 20}MB/{file_size >> 20}MB) "
+    progress_line += f"{speed:.1f}MB/s"
+    sys.stdout.write(f"\r{Colors.PRIMARY}{progress_line}{Colors.END}")
+    sys.stdout.flush()
+
+async def _download_range(session, url, start_byte, end_byte, fd, progress, thread_id, proxy):
+    headers = {'Range': f'bytes={start_byte}-{end_byte}'}
+    async with session.get(url, headers=headers, proxy=proxy) as response:
+        response.raise_for_status()
+        if response.status != 206:
+            raise ValueError(f"server ignored range request (HTTP {response.status})")
+        
+        # aiohttp yields whatever is buffered (often a few KiB), so batch the writes
+        writer = _RangeWriter(fd, start_byte, batch_size=CONFIG['chunk_size'])
+        # progress counts only bytes that have reached the file, so saved resume state never covers a hole
+        base = progress[thread_id] - start_byte
+        try:
+            async for chunk in response.content.iter_chunked(CONFIG['chunk_size']):
+                writer.write(chunk)
+                progress[thread_id] = base + writer.offset
+        finally:
+            # Keep what arrived before a failure on disk, so progress matches the file for resuming
+            writer.flush()
+            progress[thread_id] = base + writer.offset
+
+async def _download_range_h2(client, url, start_byte, end_byte, fd, progress, thread_id):
+    headers = {'Range': f'bytes={start_byte}-{end_byte}'}
+    async with client.stream('GET', url, headers=headers) as response:
+        response.raise_for_status()
+        if response.status_code != 206:
+            raise ValueError(f"server ignored range request (HTTP {response.status_code})")
+        
+        writer = _RangeWriter(fd, start_byte, batch_size=CONFIG['chunk_size'])
+        # progress counts only bytes that have reached the file, so saved resume state never covers a hole
+        base = progress[thread_id] - start_byte
+        try:
+            async for chunk in response.aiter_bytes(CONFIG['chunk_size']):
+                writer.write(chunk)
+                progress[thread_id] = base + writer.offset
+        finally:
+            # Keep what arrived before a failure on disk, so progress matches the file for resuming
+            writer.flush()
+            progress[thread_id] = base + writer.offset
+
+async def _run_range_tasks(coros, progress, file_size, show_progress, label):
+    """Run range coroutines concurrently while rendering progress; returns per-range errors"""
+    print(f"{Colors.INFO}▶ Starting {len(coros)} concurrent range requests{label}...{Colors.END}")
     
-    download_tasks = []
-    for i in range(num_threads):
-        start = i * chunk_size
-        end = start + chunk_size - 1 if i < num_threads - 1 else file_size - 1
-        download_tasks.append((start, end, i))
+    tasks = [asyncio.create_task(coro) for coro in coros]
+    start_time = time.time()
+    resumed = sum(progress)
+    pending = set(tasks)
+    while pending:
+        _, pending = await asyncio.wait(pending, timeout=0.1)
+        if show_progress:
+            print_range_progress(sum(progress), file_size, start_time, resumed)
     
-    progress_data = {'downloaded': [0] * num_threads}
-    progress_lock = threading.Lock()
+    if show_progress:
+        print()
     
-    def download_chunk(start_byte, end_byte, thread_id):
-        try:
-            session = requests.Session()
-            
-            if CONFIG['proxy_enabled']:
-                proxy_url = f"{CONFIG['proxy_type']}://"
-                if CONFIG['proxy_auth']:
-                    proxy_url += f"{CONFIG['proxy_username']}:{CONFIG['proxy_password']}@"
-                proxy_url += f"{CONFIG['proxy_host']}:{CONFIG['proxy_port']}"
-                session.proxies = {'http': proxy_url, 'https': proxy_url}
-            
-            headers = {
-                'Range': f'bytes={start_byte}-{end_byte}',
-                'User-Agent': CONFIG['user_agent']
-            }
-            
-            response = session.get(url, headers=headers, stream=True, timeout=CONFIG['timeout'], verify=CONFIG['verify_ssl'])
-            response.raise_for_status()
-            
-            temp_file = f"{filepath}.part{thread_id}"
-            with open(temp_file, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=CONFIG['chunk_size']):
-                    if chunk:
-                        f.write(chunk)
-                        with progress_lock:
-                            progress_data['downloaded'][thread_id] += len(chunk)
-            
-            return temp_file
-            
-        except Exception as e:
-            print(f"{Colors.ERROR}Thread {thread_id} error: {str(e)}{Colors.END}")
+    return [task.exception() for task in tasks]
+
+async def _download_ranges(url, fd, download_tasks, progress, file_size, show_progress):
+    """Fetch every range concurrently over one aiohttp connection pool"""
+    connector = aiohttp.TCPConnector(limit=len(download_tasks), ssl=CONFIG['verify_ssl'])
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=CONFIG['timeout'], sock_read=CONFIG['timeout'])
+    
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=_HEADERS) as session:
+        coros = [
+            _download_range(session, url, start, end, fd, progress, tid, _PROXY_URL)
+            for start, end, tid in download_tasks
+        ]
+        return await _run_range_tasks(coros, progress, file_size, show_progress, "")
+
+async def _download_ranges_h2(url, fd, download_tasks, progress, file_size, show_progress):
+    """Multiplex every range over a single HTTP/2 connection; None if the server lacks HTTP/2"""
+    limits = httpx.Limits(max_connections=1, max_keepalive_connections=1)
+    
+    async with httpx.AsyncClient(http2=True, limits=limits, timeout=CONFIG['timeout'],
+                                 verify=CONFIG['verify_ssl'], headers=_HEADERS, proxy=_PROXY_URL) as client:
+        probe = await client.head(url)
+        if probe.http_version != 'HTTP/2':
             return None
-    
-    print(f"{Colors.INFO}▶ Starting {num_threads} download threads...{Colors.END}")
-    
-    with ThreadPoolExecutor(max_workers=num_threads) as executor:
-        futures = [executor.submit(download_chunk, start, end, tid) for start, end, tid in download_tasks]
+        
+        coros = [
+            _download_range_h2(client, url, start, end, fd, progress, tid)
+            for start, end, tid in download_tasks
+        ]
+        return await _run_range_tasks(coros, progress, file_size, show_progress, " over HTTP/2")
+
+def async_download_advanced(url, fd, download_tasks, progress, file_size, show_progress=True, http2=False):
+    """Download ranges on one event loop; returns per-range errors, or None if HTTP/2 was requested but not negotiated"""
+    download_ranges = _download_ranges_h2 if http2 else _download_ranges
+    return asyncio.run(download_ranges(url, fd, download_tasks, progress, file_size, show_progress))
+
+def _thread_download_ranges(url, fd, download_tasks, progress, file_size, show_progress=True):
+    """Download ranges on a thread pool over the shared requests session; returns per-range errors"""
+    def download_chunk(session, start_byte, end_byte, thread_id):
+        headers = {'Range': f'bytes={start_byte}-{end_byte}'}
+        
+        response = session.get(url, headers=headers, stream=True, timeout=CONFIG['timeout'], verify=CONFIG['verify_ssl'])
+        response.raise_for_status()
+        if response.status_code != 206:
+            raise ValueError(f"server ignored range request (HTTP {response.status_code})")
+        
+        # Read straight into one reusable buffer instead of allocating a bytes object per chunk
+        raw = response.raw
+        raw.decode_content = True
+        buf = bytearray(CONFIG['chunk_size'])
+        view = memoryview(buf)
+        offset = start_byte
+        n = raw.readinto(buf)
+        while n:
+            pwrite_all(fd, view[:n], offset)
+            offset += n
+            progress[thread_id] += n
+            n = raw.readinto(buf)
+    
+    print(f"{Colors.INFO}▶ Starting {len(download_tasks)} download threads...{Colors.END}")
+    
+    session = get_session()
+    with ThreadPoolExecutor(max_workers=len(download_tasks)) as executor:
+        futures = [executor.submit(download_chunk, session, start, end, tid) for start, end, tid in download_tasks]
         
         start_time = time.time()
-        while not all(f.done() for f in futures):
+        resumed = sum(progress)
+        pending = set(futures)
+        while pending:
+            # Block until a worker finishes or the next progress tick is due
+            _, pending = wait(pending, timeout=0.25, return_when=FIRST_COMPLETED)
             if show_progress:
-                total_downloaded = sum(progress_data['downloaded'])
-                progress = (total_downloaded / file_size) * 100 if file_size > 0 else 0
-                elapsed = time.time() - start_time
-                speed = total_downloaded / elapsed / 1024 / 1024 if elapsed > 0 else 0
-                
-                bar_length = 50
-                filled = int(bar_length * progress / 100)
-                bar = '█' * filled + '░' * (bar_length - filled)
-                
-                progress_line = f"[{bar}] {progress:.1f}% "
-                progress_line += f"({total_downloaded//1024//1024}MB/{file_size//1024//1024}MB) "
-                progress_line += f"{speed:.1f}MB/s"
-                print(f"\r{Colors.PRIMARY}{progress_line}{Colors.END}", end="", flush=True)
-            
-            time.sleep(0.1)
+                print_range_progress(sum(progress), file_size, start_time, resumed)
         
         if show_progress:
             print()
         
-        temp_files = [f.result() for f in futures if f.result()]
-    
-    if len(temp_files) == num_threads:
-        print(f"{Colors.INFO}▶ Combining file chunks...{Colors.END}")
-        with open(filepath, 'wb') as outfile:
-            for i in range(num_threads):
-                temp_file = f"{filepath}.part{i}"
-                if os.path.exists(temp_file):
-                    with open(temp_file, 'rb') as infile:
-                        shutil.copyfileobj(infile, outfile)
-                    os.remove(temp_file)
-        return True
+        return [future.exception() for future in futures]
+
+def _fetch_ranges(url, fd, download_tasks, progress, file_size, show_progress):
+    """Fetch download_tasks into fd with the best available client; returns per-range errors"""
+    if not download_tasks:
+        return []
+    
+    # Neither async client is set up for SOCKS proxies, keep the requests path for those
+    socks_proxy = CONFIG['proxy_enabled'] and CONFIG['proxy_type'].startswith('socks')
+    
+    # HTTP/2 multiplexes every range over one TLS connection; fall through if the server lacks it
+    if HTTP2_AVAILABLE and not socks_proxy and url.startswith('https://'):
+        errors = async_download_advanced(url, fd, download_tasks, progress, file_size, show_progress, http2=True)
+        if errors is not None:
+            return errors
+    
+    if AIOHTTP_AVAILABLE and not socks_proxy:
+        return async_download_advanced(url, fd, download_tasks, progress, file_size, show_progress)
+    
+    return _thread_download_ranges(url, fd, download_tasks, progress, file_size, show_progress)
+
+def range_state_path(filepath):
+    """Sidecar recording how much of each range of a partial ranged download is on disk"""
+    return filepath + '.part.meta'
+
+def load_range_state(filepath, url, file_size):
+    """[start, end, done] ranges of a resumable partial download of url at filepath, or None"""
+    try:
+        state = _json_loads(Path(range_state_path(filepath)).read_bytes())
+        if state['url'] == url and state['size'] == file_size == os.path.getsize(filepath):
+            return state['ranges']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+def save_range_state(filepath, url, file_size, ranges, progress):
+    state = {
+        'url': url,
+        'size': file_size,
+        'ranges': [[start, end, progress[tid]] for tid, (start, end, _) in enumerate(ranges)],
+    }
+    try:
+        Path(range_state_path(filepath)).write_bytes(_json_dumps(state))
+    except OSError as e:
+        print(f"{Colors.WARNING}⚠ Could not save resume state: {e}{Colors.END}")
+
+def discard_range_state(filepath):
+    try:
+        os.remove(range_state_path(filepath))
+    except FileNotFoundError:
+        pass
+
+# Ranges smaller than this spend more time on connection setup than on transfer
+MIN_RANGE_SIZE = 4 * 1024 * 1024
+RANGE_ALIGN = 1024 * 1024
+# Seconds between resume-state saves while ranges download, bounding what a hard kill loses
+RANGE_STATE_INTERVAL = 2
+
+def split_ranges(file_size):
+    """Split file_size into (start, end, index) byte ranges of about MIN_RANGE_SIZE or more, with RANGE_ALIGN-aligned boundaries"""
+    num_threads = _clamp(min(CONFIG['max_threads'], file_size // MIN_RANGE_SIZE), 1, 16)
+    # Interior boundaries are rounded down to the alignment; the last range ends at file_size - 1
+    bounds = [0] + [(i * file_size // num_threads) & ~(RANGE_ALIGN - 1) for i in range(1, num_threads)] + [file_size]
+    
+    return [(bounds[i], bounds[i + 1] - 1, i) for i in range(num_threads)]
+
+def threaded_download_advanced(url, filepath, file_info, show_progress=True):
+    file_size = file_info['file_size']
+    
+    # A partial ranged download of the same URL picks up each range where it stopped
+    ranges = load_range_state(filepath, url, file_size) if CONFIG['resume_downloads'] else None
+    resuming = ranges is not None
+    if not resuming:
+        ranges = [[start, end, 0] for start, end, _ in split_ranges(file_size)]
+        if len(ranges) == 1:
+            return simple_download_advanced(url, filepath, file_info, show_progress)
     else:
-        print(f"{Colors.ERROR}✗ Some chunks failed to download{Colors.END}")
-        for i in range(num_threads):
-            temp_file = f"{filepath}.part{i}"
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
-        return False
+        print(f"{Colors.INFO}▶ Resuming partial download{Colors.END}")
+    
+    # One slot per range holding the bytes of it on disk, each written only by its own worker, so no lock is needed
+    progress = array('Q', [done for _, _, done in ranges])
+    download_tasks = [(start + done, end, tid) for tid, (start, end, done) in enumerate(ranges) if start + done <= end]
+    
+    # The preallocated file is full size from the start, so its state sidecar is written first and kept
+    # until every range is done; otherwise a partial file would pass for a complete one
+    save_range_state(filepath, url, file_size, ranges, progress)
+    fd = open_output_file(filepath, file_size, truncate=not resuming)
+    
+    stop_saving = threading.Event()
+    def save_periodically():
+        while not stop_saving.wait(RANGE_STATE_INTERVAL):
+            save_range_state(filepath, url, file_size, ranges, progress)
+    saver = threading.Thread(target=save_periodically, daemon=True)
+    saver.start()
+    
+    errors = None
+    try:
+        errors = _fetch_ranges(url, fd, download_tasks, progress, file_size, show_progress)
+    finally:
+        stop_saving.set()
+        saver.join()
+        os.close(fd)
+        if errors is not None and not any(errors):
+            discard_range_state(filepath)
+        elif CONFIG['resume_downloads']:
+            save_range_state(filepath, url, file_size, ranges, progress)
+        else:
+            os.remove(filepath)
+            discard_range_state(filepath)
+    
+    failed = [(tid, error) for (_, _, tid), error in zip(download_tasks, errors) if error is not None]
+    if not failed:
+        return True
+    
+    for tid, error in failed:
+        print(f"{Colors.ERROR}Range {tid} error: {str(error)}{Colors.END}")
+    print(f"{Colors.ERROR}✗ Some chunks failed to download{Colors.END}")
+    if CONFIG['resume_downloads']:
+        print(f"{Colors.INFO}Partial download kept; retry to resume it{Colors.END}")
+    return False
 
 def advanced_ftp_download():
     print(f"\n{Colors.ACCENT}╭─ FTP/FTPS Download Configuration{Colors.END}")
     
-    host = input(f"{Colors.ACCENT}├─{Colors.END} FTP Host: ")
-    port = input(f"{Colors.ACCENT}├─{Colors.END} Port (21): ") or "21"
-    username = input(f"{Colors.ACCENT}├─{Colors.END} Username (anonymous): ") or "anonymous"
-    password = getpass.getpass(f"{Colors.ACCENT}├─{Colors.END} Password: ") or ""
-    remote_path = input(f"{Colors.ACCENT}├─{Colors.END} Remote file path: ")
-    use_ftps = input(f"{Colors.ACCENT}╰─{Colors.END} Use FTPS? (y/N): ").lower() == 'y'
+    host = input(f"{ACC_L} FTP Host: ")
+    port = _parse_int(input(f"{ACC_L} Port (21): "), 1, 65535, 21)
+    username = input(f"{ACC_L} Username (anonymous): ") or "anonymous"
+    password = getpass.getpass(f"{ACC_L} Password: ") or ""
+    remote_path = input(f"{ACC_L} Remote file path: ")
+    use_ftps = input(f"{ACC_E} Use FTPS? (y/N): ")[:1] in _YES
     
     if not host or not remote_path:
         print(f"{Colors.ERROR}✗ Host and remote path are required{Colors.END}")
@@ -686,12 +1495,11 @@ def advanced_ftp_download():
         loading_animation("Establishing FTP connection")
         
         if use_ftps:
-            from ftplib import FTP_TLS
             ftp = FTP_TLS()
         else:
             ftp = FTP()
         
-        ftp.connect(host, int(port))
+        ftp.connect(host, port)
         ftp.login(username, password)
         
         if use_ftps:
@@ -708,7 +1516,7 @@ def advanced_ftp_download():
         
         print(f"\n{Colors.INFO}Downloading: {filename}")
         if file_size > 0:
-            print(f"{Colors.INFO}Size: {file_size / 1024 / 1024:.1f} MB{Colors.END}")
+            print(f"{Colors.INFO}Size: {format_size(file_size)}{Colors.END}")
         
         start_time = time.time()
         downloaded = 0
@@ -718,7 +1526,7 @@ def advanced_ftp_download():
             downloaded += len(data)
             if file_size > 0:
                 progress = (downloaded / file_size) * 100
-                speed = downloaded / (time.time() - start_time) / 1024 / 1024
+                speed = downloaded / (time.time() - start_time) * _MIB
                 print(f"\r{Colors.PRIMARY}Progress: {progress:.1f}% - {speed:.1f} MB/s{Colors.END}", end="", flush=True)
         
         with open(local_path, 'wb') as f:
@@ -743,38 +1551,37 @@ def advanced_ftp_download():
     except Exception as e:
         print(f"{Colors.ERROR}✗ FTP download failed: {str(e)}{Colors.END}")
 
-def youtube_download():
-    """Advanced YouTube/Video download with yt-dlp"""
-    if not YTDLP_AVAILABLE:
-        print(f"{Colors.ERROR}✗ yt-dlp not available. Install with: pip install yt-dlp{Colors.END}")
-        return False
-    
-    print(f"\n{Colors.ACCENT}╭─ YouTube/Video Download{Colors.END}")
-    
-    url = input(f"{Colors.ACCENT}├─{Colors.END} Video URL: ")
-    if not url.strip():
-        print(f"{Colors.ERROR}✗ URL is required{Colors.END}")
-        return False
-    
-    print(f"{Colors.ACCENT}├─{Colors.END} Quality Options:")
-    print(f"{Colors.ACCENT}│{Colors.END}  1. Best quality (default)")
-    print(f"{Colors.ACCENT}│{Colors.END}  2. Audio only (MP3)")
-    print(f"{Colors.ACCENT}│{Colors.END}  3. 1080p (if available)")
-    print(f"{Colors.ACCENT}│{Colors.END}  4. 720p")
-    print(f"{Colors.ACCENT}│{Colors.END}  5. 480p")
-    print(f"{Colors.ACCENT}│{Colors.END}  6. Custom format")
-    
-    quality = input(f"{Colors.ACCENT}╰─{Colors.END} Select quality (1): ") or "1"
-    
-    # Configure yt-dlp options
+def prompt_video_quality():
+    """Ask for a yt-dlp quality choice; returns (quality, custom_format)"""
+    print(f"{ACC_L} Quality Options:")
+    print(f"{ACC_V}  1. Best quality (default)")
+    print(f"{ACC_V}  2. Audio only (MP3)")
+    print(f"{ACC_V}  3. 1080p (if available)")
+    print(f"{ACC_V}  4. 720p")
+    print(f"{ACC_V}  5. 480p")
+    print(f"{ACC_V}  6. Custom format")
+    print(f"{ACC_V}  7. Audio only (original codec, no re-encode)")
+    
+    quality = input(f"{ACC_E} Select quality (1): ") or "1"
+    custom_format = None
+    if quality == "6":
+        custom_format = input(f"{Colors.INFO}Enter custom format (e.g., 'best[ext=mp4]'): {Colors.END}")
+    return quality, custom_format
+
+def build_ydl_opts(quality="1", custom_format=None):
+    """yt-dlp options for a quality choice from prompt_video_quality"""
     ydl_opts = {
-        'outtmpl': os.path.join(CONFIG['download_dir'], '%(title)s.%(ext)s'),
-        'writeinfojson': True,
-        'writesubtitles': True,
-        'writeautomaticsub': True,
-        'subtitleslangs': ['en'],
+        'outtmpl': _OUTTMPL,
     }
     
+    # Sidecar files cost extra requests per video (auto-captions especially), so they are opt-in
+    if CONFIG['write_info_json']:
+        ydl_opts['writeinfojson'] = True
+    if CONFIG['write_subs'] or CONFIG['write_auto_subs']:
+        ydl_opts['writesubtitles'] = CONFIG['write_subs']
+        ydl_opts['writeautomaticsub'] = CONFIG['write_auto_subs']
+        ydl_opts['subtitleslangs'] = ['en']
+    
     # Set quality based on user choice
     if quality == "1":
         ydl_opts['format'] = 'best[height<=?1080]'
@@ -794,41 +1601,93 @@ def youtube_download():
     elif quality == "5":
         ydl_opts['format'] = 'best[height<=?480]'
     elif quality == "6":
-        custom_format = input(f"{Colors.INFO}Enter custom format (e.g., 'best[ext=mp4]'): {Colors.END}")
         if custom_format:
             ydl_opts['format'] = custom_format
+    elif quality == "7":
+        # 'best' keeps the source codec, so AAC/Opus streams are remuxed with -c copy instead of re-encoded
+        ydl_opts.update({
+            'format': 'bestaudio/best',
+            'postprocessors': [{
+                'key': 'FFmpegExtractAudio',
+                'preferredcodec': 'best',
+                'nopostoverwrites': True,
+            }]
+        })
+    
+    # Fetch DASH/HLS fragments in parallel
+    connections = _clamp(CONFIG['max_threads'], 1, 16)
+    ydl_opts['concurrent_fragment_downloads'] = connections
+    
+    # Progressive (single-file) formats get split into parallel range requests by aria2c when installed
+    if shutil.which('aria2c'):
+        ydl_opts['external_downloader'] = {'http': 'aria2c'}
+        ydl_opts['external_downloader_args'] = {'aria2c': ['-x', str(connections), '-s', str(connections), '-k', '1M']}
     
     # Add proxy support if enabled
-    if CONFIG['proxy_enabled']:
-        proxy_url = f"{CONFIG['proxy_type']}://"
-        if CONFIG['proxy_auth']:
-            proxy_url += f"{CONFIG['proxy_username']}:{CONFIG['proxy_password']}@"
-        proxy_url += f"{CONFIG['proxy_host']}:{CONFIG['proxy_port']}"
-        ydl_opts['proxy'] = proxy_url
+    if _PROXY_URL:
+        ydl_opts['proxy'] = _PROXY_URL
     
-    # Progress hook
-    def progress_hook(d):
+    return ydl_opts
+
+def make_video_progress_hook():
+    """yt-dlp progress hook that redraws at most every PROGRESS_INTERVAL seconds"""
+    last_draw = 0.0
+    
+    # yt-dlp calls this on every block, often dozens of times a second; globals are bound as defaults
+    def progress_hook(d, monotonic=time.monotonic, interval=PROGRESS_INTERVAL, primary=Colors.PRIMARY,
+                      end=Colors.END, bars=_BARS_40, mib=_MIB, stdout=sys.stdout):
+        nonlocal last_draw
         if d['status'] == 'downloading':
+            now = monotonic()
+            if now - last_draw < interval:
+                return
+            last_draw = now
+            
+            speed = d.get('speed', 0)
+            speed_str = f"{speed * mib:.1f} MB/s" if speed else "-- MB/s"
             if 'total_bytes' in d:
                 progress = (d.get('downloaded_bytes', 0) / d['total_bytes']) * 100
-                speed = d.get('speed', 0)
-                speed_str = f"{speed/1024/1024:.1f} MB/s" if speed else "-- MB/s"
-                
-                bar_length = 40
-                filled = int(bar_length * progress / 100)
-                bar = '█' * filled + '░' * (bar_length - filled)
-                
-                print(f"\r{Colors.PRIMARY}[{bar}] {progress:.1f}% - {speed_str}{Colors.END}", end="", flush=True)
+                bar = bars[min(40, int(40 * progress / 100))]
+                stdout.write(f"\r{primary}[{bar}] {progress:.1f}% - {speed_str}{end}")
             else:
                 # For streams without total size info
                 downloaded = d.get('downloaded_bytes', 0)
-                speed = d.get('speed', 0)
-                speed_str = f"{speed/1024/1024:.1f} MB/s" if speed else "-- MB/s"
-                print(f"\r{Colors.PRIMARY}Downloaded: {downloaded/1024/1024:.1f}MB - {speed_str}{Colors.END}", end="", flush=True)
+                stdout.write(f"\r{primary}Downloaded: {downloaded * mib:.1f}MB - {speed_str}{end}")
+            stdout.flush()
         elif d['status'] == 'finished':
             print(f"\n{Colors.SUCCESS}✓ Download completed: {d['filename']}{Colors.END}")
     
-    ydl_opts['progress_hooks'] = [progress_hook]
+    return progress_hook
+
+def record_video_download(url, info, duration):
+    with _STATS_LOCK:
+        # Update stats
+        STATS['total_downloads'] += 1
+        if 'filesize' in info:
+            STATS['total_bytes'] += info['filesize']
+        
+        # Add to history
+        if CONFIG['download_history']:
+            DOWNLOAD_HISTORY.add(url, info.get('title', 'Unknown'), info.get('filesize', 0), duration,
+                                 0,  # yt-dlp handles speed internally
+                                 time.time_ns(), type='youtube')
+            mark_history_dirty()
+
+def youtube_download():
+    """Advanced YouTube/Video download with yt-dlp"""
+    if not load_ytdlp():
+        print(f"{Colors.ERROR}✗ yt-dlp not available. Install with: pip install yt-dlp{Colors.END}")
+        return False
+    
+    print(f"\n{Colors.ACCENT}╭─ YouTube/Video Download{Colors.END}")
+    
+    url = input(f"{ACC_L} Video URL: ")
+    if not url.strip():
+        print(f"{Colors.ERROR}✗ URL is required{Colors.END}")
+        return False
+    
+    ydl_opts = build_ydl_opts(*prompt_video_quality())
+    ydl_opts['progress_hooks'] = [make_video_progress_hook()]
     
     try:
         # Create download directory
@@ -842,52 +1701,36 @@ def youtube_download():
                 info = ydl.extract_info(url, download=False)
                 
                 print(f"\n{Colors.INFO}╭─ Video Information{Colors.END}")
-                print(f"{Colors.INFO}├─{Colors.END} {Colors.WHITE}Title:{Colors.END} {info.get('title', 'Unknown')[:60]}")
-                print(f"{Colors.INFO}├─{Colors.END} {Colors.WHITE}Uploader:{Colors.END} {info.get('uploader', 'Unknown')}")
-                print(f"{Colors.INFO}├─{Colors.END} {Colors.WHITE}Duration:{Colors.END} {info.get('duration_string', 'Unknown')}")
-                print(f"{Colors.INFO}├─{Colors.END} {Colors.WHITE}View Count:{Colors.END} {info.get('view_count', 'Unknown')}")
+                print(f"{INFO_L} {Colors.WHITE}Title:{Colors.END} {info.get('title', 'Unknown')[:60]}")
+                print(f"{INFO_L} {Colors.WHITE}Uploader:{Colors.END} {info.get('uploader', 'Unknown')}")
+                print(f"{INFO_L} {Colors.WHITE}Duration:{Colors.END} {info.get('duration_string', 'Unknown')}")
+                print(f"{INFO_L} {Colors.WHITE}View Count:{Colors.END} {info.get('view_count', 'Unknown')}")
                 
-                # Show available formats
-                if 'formats' in info:
-                    print(f"{Colors.INFO}├─{Colors.END} {Colors.WHITE}Available Formats:{Colors.END}")
-                    formats = info['formats'][-5:]  # Show last 5 formats
-                    for fmt in formats:
-                        resolution = fmt.get('resolution', 'audio only')
-                        filesize = fmt.get('filesize', 0)
+                # Show available formats (last 5); the full info dict is kept since the download reuses it
+                formats = info.get('formats')
+                if formats:
+                    print(f"{INFO_L} {Colors.WHITE}Available Formats:{Colors.END}")
+                    for fmt in formats[-5:]:
+                        resolution, ext, filesize = fmt.get('resolution', 'audio only'), fmt.get('ext', 'unknown'), fmt.get('filesize')
                         size_str = f"{filesize/1024/1024:.1f}MB" if filesize else "Unknown size"
-                        print(f"{Colors.INFO}│{Colors.END}   {resolution} ({fmt.get('ext', 'unknown')}) - {size_str}")
+                        print(f"{INFO_V}   {resolution} ({ext}) - {size_str}")
                 
-                print(f"{Colors.INFO}╰─{Colors.END} {Colors.WHITE}URL:{Colors.END} {url}")
+                print(f"{INFO_E} {Colors.WHITE}URL:{Colors.END} {url}")
                 
-                confirm = input(f"\n{Colors.ACCENT}Continue download? (Y/n): {Colors.END}").lower()
-                if confirm == 'n':
+                confirm = input(f"\n{Colors.ACCENT}Continue download? (Y/n): {Colors.END}")[:1]
+                if confirm in _NO:
                     return False
                 
                 start_time = time.time()
                 
-                # Download the video
+                # Download from the info already extracted above instead of re-running the extractor
                 print(f"\n{Colors.INFO}▶ Starting download...{Colors.END}")
-                ydl.download([url])
+                info = ydl.process_ie_result(info, download=True)
                 
                 duration = time.time() - start_time
                 print(f"\n{Colors.SUCCESS}✓ Video download completed in {duration:.1f}s{Colors.END}")
                 
-                # Update stats
-                STATS['total_downloads'] += 1
-                if 'filesize' in info:
-                    STATS['total_bytes'] += info['filesize']
-                
-                # Add to history
-                if CONFIG['download_history']:
-                    DOWNLOAD_HISTORY.append({
-                        'url': url,
-                        'filename': info.get('title', 'Unknown'),
-                        'size': info.get('filesize', 0),
-                        'duration': duration,
-                        'speed': 0,  # yt-dlp handles speed internally
-                        'timestamp': datetime.now().isoformat(),
-                        'type': 'youtube'
-                    })
+                record_video_download(url, info, duration)
                 
                 return True
                 
@@ -897,20 +1740,186 @@ def youtube_download():
                 
     except Exception as e:
         print(f"{Colors.ERROR}✗ YouTube download failed: {str(e)}{Colors.END}")
-        STATS['failed_downloads'] += 1
+        with _STATS_LOCK:
+            STATS['failed_downloads'] += 1
         return False
 
+def fetch_video(url, ydl):
+    """Network stage: extract and download one video; returns its info dict, or None on failure"""
+    try:
+        return ydl.extract_info(url, download=True)
+    except Exception as e:
+        print(f"{Colors.ERROR}✗ {url[:60]}: {e}{Colors.END}")
+        with _STATS_LOCK:
+            STATS['failed_downloads'] += 1
+        return None
+
+def requested_downloads(info):
+    """Yield the downloaded files of a fetched video, or of every video in a (nested) playlist"""
+    yield from info.get('requested_downloads') or []
+    for entry in info.get('entries') or []:
+        if entry:
+            yield from requested_downloads(entry)
+
+def postprocess_video(url, info, ydl):
+    """CPU stage: run ydl's post-processors (e.g. ffmpeg audio extraction) on a fetched video; returns success"""
+    try:
+        for download in requested_downloads(info):
+            ydl.post_process(download['filepath'], download)
+        return True
+    except Exception as e:
+        print(f"{Colors.ERROR}✗ Post-processing failed for {url[:60]}: {e}{Colors.END}")
+        with _STATS_LOCK:
+            STATS['failed_downloads'] += 1
+        return False
+
+def iter_urls(path):
+    """Yield the non-empty lines of a URL list file, reading it lazily"""
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield line
+
+def count_urls(path):
+    """Count the URLs iter_urls will yield for a list file, without keeping them"""
+    # Same decoding, newline and whitespace rules as iter_urls, so totals match what gets processed
+    return sum(1 for _ in iter_urls(path))
+
+def _run_parallel(jobs, concurrent, total=None):
+    """Run (url, callable) jobs with up to `concurrent` in flight; returns (successful, processed)
+    
+    jobs may be a lazy iterable: each of the `concurrent` workers pulls its next job only once it is
+    free, so nothing is queued up front. A job may return a Future for a follow-up stage instead of
+    a bool; it is tallied when that finishes, without holding the worker.
+    """
+    return asyncio.run(_run_jobs(iter(jobs), concurrent, total))
+
+async def _run_jobs(jobs, concurrent, total):
+    """Event-loop side of _run_parallel: blocking job bodies run on a thread pool, bookkeeping and output stay on the loop"""
+    loop = asyncio.get_running_loop()
+    successful = 0
+    done = 0
+    followups = set()
+    
+    def tally(url, ok):
+        nonlocal successful, done
+        done += 1
+        if ok:
+            successful += 1
+        mark = f"{Colors.SUCCESS}✓" if ok else f"{Colors.ERROR}✗"
+        counter = f"{done}/{total}" if total else done
+        print(f"{Colors.ACCENT}[{counter}]{Colors.END} {mark} {url[:60]}{Colors.END}")
+    
+    async def settle(url, awaitable):
+        try:
+            return await awaitable
+        except Exception as e:
+            print(f"{Colors.ERROR}✗ {url[:60]}: {e}{Colors.END}")
+            return False
+    
+    async def follow(url, future):
+        tally(url, await settle(url, asyncio.wrap_future(future)))
+    
+    async def worker(executor):
+        # The job iterator is shared, but only ever advanced from the loop thread
+        for url, fn in jobs:
+            ok = await settle(url, loop.run_in_executor(executor, fn))
+            if isinstance(ok, Future):
+                task = asyncio.create_task(follow(url, ok))
+                followups.add(task)
+                task.add_done_callback(followups.discard)
+            else:
+                tally(url, ok)
+    
+    try:
+        with ThreadPoolExecutor(max_workers=concurrent) as executor:
+            await asyncio.gather(*(worker(executor) for _ in range(concurrent)))
+            await asyncio.gather(*followups)
+    finally:
+        # One history write per batch, off the workers' _STATS_LOCK
+        flush_history()
+    
+    return successful, done
+
+def _url_count(urls):
+    return len(urls) if hasattr(urls, '__len__') else None
+
+def run_batch(urls, concurrent, total=None):
+    """Download urls (any iterable) with up to `concurrent` transfers in flight; returns (successful, processed)"""
+    # Each job validates and HEADs its own URL, so probes overlap across workers without
+    # needing the whole list up front
+    jobs = ((url, functools.partial(professional_download, url, show_progress=False, interactive=False)) for url in urls)
+    configure_session(get_session(), concurrent)
+    return _run_parallel(jobs, concurrent, total or _url_count(urls))
+
+def run_video_batch(urls, concurrent, ydl_opts, total=None):
+    """Download videos (any iterable of URLs) with up to `concurrent` in flight; returns (successful, processed)
+    
+    Post-processors (ffmpeg) run on a separate CPU pool so that transcoding one video overlaps
+    the download of the next instead of holding a download worker.
+    """
+    post_pps = [pp for pp in ydl_opts.get('postprocessors', []) if pp.get('when', 'post_process') in ('post_process', 'after_move')]
+    fetch_opts = dict(ydl_opts, postprocessors=[pp for pp in ydl_opts.get('postprocessors', []) if pp not in post_pps])
+    post_workers = max(1, (os.cpu_count() or 2) // 2)
+    post_executor = ThreadPoolExecutor(max_workers=post_workers) if post_pps else None
+    # Downloads block here once this many fetched files are waiting for post-processing
+    post_slots = threading.BoundedSemaphore(post_workers * 2)
+    
+    # One YoutubeDL per worker thread and stage, reused for every URL that worker picks up, so
+    # extractor setup and the connection pool are paid once per thread rather than once per video
+    fetch_local = threading.local()
+    post_local = threading.local()
+    instances = []
+    
+    def thread_ydl(local, opts):
+        ydl = getattr(local, 'ydl', None)
+        if ydl is None:
+            ydl = local.ydl = yt_dlp.YoutubeDL(opts)
+            instances.append(ydl)
+        return ydl
+    
+    def post_worker(url, info, start_time):
+        try:
+            ok = postprocess_video(url, info, thread_ydl(post_local, ydl_opts))
+        finally:
+            post_slots.release()
+        if ok:
+            record_video_download(url, info, time.time() - start_time)
+        return ok
+    
+    def worker(url):
+        start_time = time.time()
+        info = fetch_video(url, thread_ydl(fetch_local, fetch_opts))
+        if info is None:
+            return False
+        if post_executor is None:
+            record_video_download(url, info, time.time() - start_time)
+            return True
+        post_slots.acquire()
+        return post_executor.submit(post_worker, url, info, start_time)
+    
+    os.makedirs(CONFIG['download_dir'], exist_ok=True)
+    try:
+        return _run_parallel(((url, functools.partial(worker, url)) for url in urls), concurrent, total or _url_count(urls))
+    finally:
+        if post_executor is not None:
+            post_executor.shutdown()
+        for ydl in instances:
+            ydl.close()
+
 def batch_download_manager():
     print(f"\n{Colors.ACCENT}╭─ Batch Download Manager{Colors.END}")
     
-    print(f"{Colors.ACCENT}├─{Colors.END} Input Methods:")
-    print(f"{Colors.ACCENT}│{Colors.END}  1. Manual URL entry")
-    print(f"{Colors.ACCENT}│{Colors.END}  2. Import from file")
-    print(f"{Colors.ACCENT}│{Colors.END}  3. Import from clipboard")
+    print(f"{ACC_L} Input Methods:")
+    print(f"{ACC_V}  1. Manual URL entry")
+    print(f"{ACC_V}  2. Import from file")
+    print(f"{ACC_V}  3. Import from clipboard")
     
-    method = input(f"{Colors.ACCENT}╰─{Colors.END} Select method (1): ") or "1"
+    method = input(f"{ACC_E} Select method (1): ") or "1"
     
     urls = []
+    total = None
     
     if method == "1":
         print(f"{Colors.INFO}Enter URLs (one per line, empty line to finish):{Colors.END}")
@@ -922,12 +1931,13 @@ def batch_download_manager():
     
     elif method == "2":
         file_path = input(f"{Colors.INFO}Enter file path: {Colors.END}")
+        # Streamed as the batch runs, so large lists are never held in memory; a counting pass gives the total
         try:
-            with open(file_path, 'r') as f:
-                urls = [line.strip() for line in f if line.strip()]
-        except Exception as e:
+            total = count_urls(file_path)
+        except (OSError, UnicodeDecodeError) as e:
             print(f"{Colors.ERROR}✗ Failed to read file: {e}{Colors.END}")
             return
+        urls = iter_urls(file_path)
     
     elif method == "3":
         try:
@@ -938,58 +1948,66 @@ def batch_download_manager():
             print(f"{Colors.ERROR}✗ pyperclip not available. Install with: pip install pyperclip{Colors.END}")
             return
     
-    if not urls:
+    if isinstance(urls, list):
+        total = len(urls)
+    if not total:
         print(f"{Colors.WARNING}⚠ No URLs provided{Colors.END}")
         return
+    print(f"\n{Colors.INFO}Found {total} URLs to download{Colors.END}")
     
-    print(f"\n{Colors.INFO}Found {len(urls)} URLs to download{Colors.END}")
+    default_concurrent = CONFIG['concurrent_downloads']
+    concurrent = input(f"{Colors.INFO}Max concurrent downloads ({default_concurrent}): {Colors.END}") or str(default_concurrent)
+    concurrent = _parse_int(concurrent, 1, 10, default_concurrent)
     
-    concurrent = input(f"{Colors.INFO}Max concurrent downloads (4): {Colors.END}") or "4"
-    try:
-        concurrent = max(1, min(10, int(concurrent)))
-    except ValueError:
-        concurrent = 4
-    
-    successful = 0
-    failed = 0
+    video_mode = input(f"{Colors.INFO}Download as videos with yt-dlp? (y/N): {Colors.END}")[:1] in _YES
+    if video_mode:
+        if not load_ytdlp():
+            print(f"{Colors.ERROR}✗ yt-dlp not available. Install with: pip install yt-dlp{Colors.END}")
+            return
+        ydl_opts = build_ydl_opts(*prompt_video_quality())
+        # Parallel jobs would interleave yt-dlp's console output
+        ydl_opts.update({'quiet': True, 'no_warnings': True, 'noprogress': True})
     
     print(f"\n{Colors.PRIMARY}Starting batch download with {concurrent} concurrent downloads...{Colors.END}")
     
-    for i, url in enumerate(urls, 1):
-        print(f"\n{Colors.ACCENT}[{i}/{len(urls)}] Processing: {url[:60]}...{Colors.END}")
-        
-        if professional_download(url, show_progress=False):
-            successful += 1
+    try:
+        if video_mode:
+            successful, total = run_video_batch(urls, concurrent, ydl_opts, total)
         else:
-            failed += 1
+            successful, total = run_batch(urls, concurrent, total)
+    except (OSError, UnicodeDecodeError) as e:
+        # A streamed URL file can still fail part-way through
+        print(f"{Colors.ERROR}✗ Failed to read file: {e}{Colors.END}")
+        return
+    failed = total - successful
     
     print(f"\n{Colors.SUCCESS}╭─ Batch Download Complete{Colors.END}")
     print(f"{Colors.SUCCESS}├─{Colors.END} Successful: {successful}")
     print(f"{Colors.SUCCESS}├─{Colors.END} Failed: {failed}")
-    print(f"{Colors.SUCCESS}╰─{Colors.END} Total: {len(urls)}")
+    print(f"{Colors.SUCCESS}╰─{Colors.END} Total: {total}")
 
 def advanced_settings_menu():
     """Comprehensive advanced settings menu"""
     while True:
         print_header()
         print(f"{Colors.ACCENT}╭─ Advanced Settings{Colors.END}")
-        print(f"{Colors.ACCENT}├─{Colors.END} Network & Connection")
-        print(f"{Colors.ACCENT}│{Colors.END}  {Colors.SUCCESS}1.{Colors.END} Download Directories")
-        print(f"{Colors.ACCENT}│{Colors.END}  {Colors.SUCCESS}2.{Colors.END} Network Configuration")
-        print(f"{Colors.ACCENT}│{Colors.END}  {Colors.SUCCESS}3.{Colors.END} Proxy Settings")
-        print(f"{Colors.ACCENT}│{Colors.END}  {Colors.SUCCESS}4.{Colors.END} VPN Integration")
-        print(f"{Colors.ACCENT}├─{Colors.END} Performance & Security")
-        print(f"{Colors.ACCENT}│{Colors.END}  {Colors.SUCCESS}5.{Colors.END} Download Behavior")
-        print(f"{Colors.ACCENT}│{Colors.END}  {Colors.SUCCESS}6.{Colors.END} Security Options")
-        print(f"{Colors.ACCENT}│{Colors.END}  {Colors.SUCCESS}7.{Colors.END} Rate Limiting")
-        print(f"{Colors.ACCENT}├─{Colors.END} System Management")
-        print(f"{Colors.ACCENT}│{Colors.END}  {Colors.SUCCESS}8.{Colors.END} File Management")
-        print(f"{Colors.ACCENT}│{Colors.END}  {Colors.SUCCESS}9.{Colors.END} System Resources")
-        print(f"{Colors.ACCENT}│{Colors.END}  {Colors.SUCCESS}10.{Colors.END} Logging & History")
-        print(f"{Colors.ACCENT}├─{Colors.END} Configuration")
-        print(f"{Colors.ACCENT}│{Colors.END}  {Colors.SUCCESS}11.{Colors.END} Import/Export Config")
-        print(f"{Colors.ACCENT}│{Colors.END}  {Colors.SUCCESS}12.{Colors.END} Reset to Defaults")
-        print(f"{Colors.ACCENT}╰─{Colors.END}  {Colors.WARNING}13.{Colors.END} Back to Main Menu")
+        print(f"{ACC_L} Network & Connection")
+        print(f"{ACC_V}  {Colors.SUCCESS}1.{Colors.END} Download Directories")
+        print(f"{ACC_V}  {Colors.SUCCESS}2.{Colors.END} Network Configuration")
+        print(f"{ACC_V}  {Colors.SUCCESS}3.{Colors.END} Proxy Settings")
+        print(f"{ACC_V}  {Colors.SUCCESS}4.{Colors.END} VPN Integration")
+        print(f"{ACC_L} Performance & Security")
+        print(f"{ACC_V}  {Colors.SUCCESS}5.{Colors.END} Download Behavior")
+        print(f"{ACC_V}  {Colors.SUCCESS}6.{Colors.END} Security Options")
+        print(f"{ACC_V}  {Colors.SUCCESS}7.{Colors.END} Rate Limiting")
+        print(f"{ACC_L} System Management")
+        print(f"{ACC_V}  {Colors.SUCCESS}8.{Colors.END} File Management")
+        print(f"{ACC_V}  {Colors.SUCCESS}9.{Colors.END} System Resources")
+        print(f"{ACC_V}  {Colors.SUCCESS}10.{Colors.END} Logging & History")
+        print(f"{ACC_L} Configuration")
+        print(f"{ACC_V}  {Colors.SUCCESS}11.{Colors.END} Import/Export Config")
+        print(f"{ACC_V}  {Colors.SUCCESS}12.{Colors.END} Reset to Defaults")
+        print(f"{ACC_E}  {Colors.WARNING}13.{Colors.END} Back to Main Menu")
         
         choice = input(f"\n{Colors.BOLD}▶ Select option (1-13): {Colors.END}")
         
@@ -1023,19 +2041,31 @@ def advanced_settings_menu():
             print(f"{Colors.ERROR}✗ Invalid option{Colors.END}")
             time.sleep(1)
 
+def create_directories(base_dir, names):
+    """Create base_dir/name for each name, shallowest first so shared parents already exist; returns [(path, error)]"""
+    paths = {Path(base_dir) / name for name in names}
+    results = []
+    for path in sorted(paths, key=lambda p: len(p.parts)):
+        try:
+            path.mkdir(parents=True, exist_ok=True)
+            results.append((path, None))
+        except OSError as e:
+            results.append((path, e))
+    return results
+
 def configure_directories():
     """Configure download and temporary directories"""
     print(f"\n{Colors.ACCENT}╭─ Directory Configuration{Colors.END}")
     
     print(f"{Colors.INFO}Current Settings:{Colors.END}")
-    print(f"{Colors.INFO}├─{Colors.END} Download Directory: {CONFIG['download_dir']}")
-    print(f"{Colors.INFO}╰─{Colors.END} Temp Directory: {CONFIG['temp_dir']}")
+    print(f"{INFO_L} Download Directory: {CONFIG['download_dir']}")
+    print(f"{INFO_E} Temp Directory: {CONFIG['temp_dir']}")
     
     print(f"\n{Colors.ACCENT}╭─ Options{Colors.END}")
-    print(f"{Colors.ACCENT}├─{Colors.END} 1. Change download directory")
-    print(f"{Colors.ACCENT}├─{Colors.END} 2. Change temp directory")
-    print(f"{Colors.ACCENT}├─{Colors.END} 3. Create directory structure")
-    print(f"{Colors.ACCENT}╰─{Colors.END} 4. Check directory permissions")
+    print(f"{ACC_L} 1. Change download directory")
+    print(f"{ACC_L} 2. Change temp directory")
+    print(f"{ACC_L} 3. Create directory structure")
+    print(f"{ACC_E} 4. Check directory permissions")
     
     choice = input(f"\n{Colors.BOLD}Select option (1-4): {Colors.END}")
     
@@ -1047,7 +2077,7 @@ def configure_directories():
                 os.makedirs(expanded_dir, exist_ok=True)
                 CONFIG['download_dir'] = expanded_dir
                 print(f"{Colors.SUCCESS}✓ Download directory updated: {expanded_dir}{Colors.END}")
-                save_config()
+                mark_config_dirty()
             except Exception as e:
                 print(f"{Colors.ERROR}✗ Failed to create directory: {e}{Colors.END}")
     
@@ -1059,7 +2089,7 @@ def configure_directories():
                 os.makedirs(expanded_temp, exist_ok=True)
                 CONFIG['temp_dir'] = expanded_temp
                 print(f"{Colors.SUCCESS}✓ Temp directory updated: {expanded_temp}{Colors.END}")
-                save_config()
+                mark_config_dirty()
             except Exception as e:
                 print(f"{Colors.ERROR}✗ Failed to create temp directory: {e}{Colors.END}")
     
@@ -1073,14 +2103,11 @@ def configure_directories():
             'logs'
         ]
         
-        base_dir = CONFIG['download_dir']
-        for dir_name in dirs_to_create:
-            full_path = os.path.join(base_dir, dir_name)
-            try:
-                os.makedirs(full_path, exist_ok=True)
+        for full_path, error in create_directories(CONFIG['download_dir'], dirs_to_create):
+            if error is None:
                 print(f"{Colors.SUCCESS}✓ Created: {full_path}{Colors.END}")
-            except Exception as e:
-                print(f"{Colors.ERROR}✗ Failed to create {full_path}: {e}{Colors.END}")
+            else:
+                print(f"{Colors.ERROR}✗ Failed to create {full_path}: {error}{Colors.END}")
     
     elif choice == '4':
         dirs_to_check = [CONFIG['download_dir'], CONFIG['temp_dir']]
@@ -1102,28 +2129,28 @@ def configure_network():
     print(f"\n{Colors.ACCENT}╭─ Network Configuration{Colors.END}")
     
     print(f"{Colors.INFO}Current Settings:{Colors.END}")
-    print(f"{Colors.INFO}├─{Colors.END} Timeout: {CONFIG['timeout']}s")
-    print(f"{Colors.INFO}├─{Colors.END} Retries: {CONFIG['retries']}")
-    print(f"{Colors.INFO}├─{Colors.END} SSL Verification: {CONFIG['verify_ssl']}")
-    print(f"{Colors.INFO}├─{Colors.END} User Agent: {CONFIG['user_agent']}")
-    print(f"{Colors.INFO}╰─{Colors.END} Connection Pool: {CONFIG['connection_pool_size']}")
+    print(f"{INFO_L} Timeout: {CONFIG['timeout']}s")
+    print(f"{INFO_L} Retries: {CONFIG['retries']}")
+    print(f"{INFO_L} SSL Verification: {CONFIG['verify_ssl']}")
+    print(f"{INFO_L} User Agent: {CONFIG['user_agent']}")
+    print(f"{INFO_E} Connection Pool: {CONFIG['connection_pool_size']}")
     
     print(f"\n1. Timeout (current: {CONFIG['timeout']}s)")
     new_timeout = input(f"   New timeout in seconds (Enter to skip): ")
-    if new_timeout.isdigit():
-        CONFIG['timeout'] = int(new_timeout)
+    if (timeout := _parse_int(new_timeout, 1)) is not None:
+        CONFIG['timeout'] = timeout
         print(f"{Colors.SUCCESS}✓ Timeout updated to {CONFIG['timeout']}s{Colors.END}")
     
     print(f"\n2. Retries (current: {CONFIG['retries']})")
     new_retries = input(f"   New retry count (Enter to skip): ")
-    if new_retries.isdigit():
-        CONFIG['retries'] = int(new_retries)
+    if (retries := _parse_int(new_retries, 0)) is not None:
+        CONFIG['retries'] = retries
         print(f"{Colors.SUCCESS}✓ Retries updated to {CONFIG['retries']}{Colors.END}")
     
     print(f"\n3. SSL Verification (current: {CONFIG['verify_ssl']})")
-    ssl_choice = input(f"   Enable SSL verification? (y/n, Enter to skip): ").lower()
-    if ssl_choice in ['y', 'n']:
-        CONFIG['verify_ssl'] = ssl_choice == 'y'
+    ssl_choice = input(f"   Enable SSL verification? (y/n, Enter to skip): ")[:1]
+    if ssl_choice in _YES_NO:
+        CONFIG['verify_ssl'] = ssl_choice in _YES
         print(f"{Colors.SUCCESS}✓ SSL verification {'enabled' if CONFIG['verify_ssl'] else 'disabled'}{Colors.END}")
     
     print(f"\n4. User Agent (current: {CONFIG['user_agent'][:50]}...)")
@@ -1134,11 +2161,11 @@ def configure_network():
     
     print(f"\n5. Connection Pool Size (current: {CONFIG['connection_pool_size']})")
     new_pool = input(f"   New pool size (Enter to skip): ")
-    if new_pool.isdigit():
-        CONFIG['connection_pool_size'] = max(1, min(50, int(new_pool)))
+    if (pool_size := _parse_int(new_pool, 1, 50)) is not None:
+        CONFIG['connection_pool_size'] = pool_size
         print(f"{Colors.SUCCESS}✓ Connection pool updated to {CONFIG['connection_pool_size']}{Colors.END}")
     
-    save_config()
+    mark_config_dirty()
     input(f"\n{Colors.MUTED}Press Enter to continue...{Colors.END}")
 
 def configure_proxy():
@@ -1149,13 +2176,13 @@ def configure_proxy():
     print(f"{Colors.INFO}Current Status: {current_status}{Colors.END}")
     
     if CONFIG['proxy_enabled']:
-        print(f"{Colors.INFO}├─{Colors.END} Type: {CONFIG['proxy_type']}")
-        print(f"{Colors.INFO}├─{Colors.END} Host: {CONFIG['proxy_host']}")
-        print(f"{Colors.INFO}├─{Colors.END} Port: {CONFIG['proxy_port']}")
+        print(f"{INFO_L} Type: {CONFIG['proxy_type']}")
+        print(f"{INFO_L} Host: {CONFIG['proxy_host']}")
+        print(f"{INFO_L} Port: {CONFIG['proxy_port']}")
         auth_status = "Yes" if CONFIG['proxy_auth'] else "No"
-        print(f"{Colors.INFO}╰─{Colors.END} Authentication: {auth_status}")
+        print(f"{INFO_E} Authentication: {auth_status}")
     
-    enable = input(f"\nEnable proxy? (y/n): ").lower() == 'y'
+    enable = input(f"\nEnable proxy? (y/n): ")[:1] in _YES
     CONFIG['proxy_enabled'] = enable
     
     if enable:
@@ -1163,10 +2190,10 @@ def configure_proxy():
         CONFIG['proxy_host'] = input(f"Proxy host [{CONFIG['proxy_host']}]: ") or CONFIG['proxy_host']
         
         port_input = input(f"Proxy port [{CONFIG['proxy_port']}]: ")
-        if port_input.isdigit():
-            CONFIG['proxy_port'] = port_input
+        if (port := _parse_int(port_input, 1, 65535)) is not None:
+            CONFIG['proxy_port'] = str(port)
         
-        auth_enable = input(f"Enable authentication? (y/n): ").lower() == 'y'
+        auth_enable = input(f"Enable authentication? (y/n): ")[:1] in _YES
         CONFIG['proxy_auth'] = auth_enable
         
         if auth_enable:
@@ -1174,7 +2201,7 @@ def configure_proxy():
             CONFIG['proxy_password'] = getpass.getpass(f"Password: ") or CONFIG['proxy_password']
     
     print(f"{Colors.SUCCESS}✓ Proxy configuration {'enabled' if enable else 'disabled'}{Colors.END}")
-    save_config()
+    mark_config_dirty()
     input(f"\n{Colors.MUTED}Press Enter to continue...{Colors.END}")
 
 def configure_vpn():
@@ -1185,10 +2212,10 @@ def configure_vpn():
     print(f"{Colors.INFO}Current Status: {current_status}{Colors.END}")
     
     if CONFIG['vpn_enabled']:
-        print(f"{Colors.INFO}├─{Colors.END} Type: {CONFIG['vpn_type']}")
-        print(f"{Colors.INFO}╰─{Colors.END} Config Path: {CONFIG['vpn_config_path']}")
+        print(f"{INFO_L} Type: {CONFIG['vpn_type']}")
+        print(f"{INFO_E} Config Path: {CONFIG['vpn_config_path']}")
     
-    enable = input(f"\nEnable VPN integration? (y/n): ").lower() == 'y'
+    enable = input(f"\nEnable VPN integration? (y/n): ")[:1] in _YES
     CONFIG['vpn_enabled'] = enable
     
     if enable:
@@ -1208,7 +2235,7 @@ def configure_vpn():
         print(f"{Colors.WARNING}Note: VPN integration requires manual setup and appropriate software{Colors.END}")
     
     print(f"{Colors.SUCCESS}✓ VPN integration {'enabled' if enable else 'disabled'}{Colors.END}")
-    save_config()
+    mark_config_dirty()
     input(f"\n{Colors.MUTED}Press Enter to continue...{Colors.END}")
 
 def configure_download_behavior():
@@ -1216,45 +2243,60 @@ def configure_download_behavior():
     print(f"\n{Colors.ACCENT}╭─ Download Behavior{Colors.END}")
     
     print(f"{Colors.INFO}Current Settings:{Colors.END}")
-    print(f"{Colors.INFO}├─{Colors.END} Max Threads: {CONFIG['max_threads']}")
-    print(f"{Colors.INFO}├─{Colors.END} Chunk Size: {CONFIG['chunk_size']} bytes")
-    print(f"{Colors.INFO}├─{Colors.END} Concurrent Downloads: {CONFIG['concurrent_downloads']}")
-    print(f"{Colors.INFO}├─{Colors.END} Auto Rename: {CONFIG['auto_rename']}")
-    print(f"{Colors.INFO}├─{Colors.END} Resume Downloads: {CONFIG['resume_downloads']}")
-    print(f"{Colors.INFO}╰─{Colors.END} Auto Extract: {CONFIG['auto_extract']}")
+    print(f"{INFO_L} Max Threads: {CONFIG['max_threads']}")
+    print(f"{INFO_L} Chunk Size: {CONFIG['chunk_size']} bytes")
+    print(f"{INFO_L} Concurrent Downloads: {CONFIG['concurrent_downloads']}")
+    print(f"{INFO_L} Auto Rename: {CONFIG['auto_rename']}")
+    print(f"{INFO_L} Resume Downloads: {CONFIG['resume_downloads']}")
+    print(f"{INFO_L} Auto Extract: {CONFIG['auto_extract']}")
+    print(f"{INFO_L} Video Info JSON: {CONFIG['write_info_json']}")
+    print(f"{INFO_L} Video Subtitles: {CONFIG['write_subs']}")
+    print(f"{INFO_E} Auto-generated Subtitles: {CONFIG['write_auto_subs']}")
     
     print(f"\n1. Max Threads (1-32)")
     threads = input(f"   New value [{CONFIG['max_threads']}]: ")
-    if threads.isdigit():
-        CONFIG['max_threads'] = max(1, min(32, int(threads)))
+    CONFIG['max_threads'] = _parse_int(threads, 1, 32, CONFIG['max_threads'])
     
     print(f"\n2. Chunk Size (bytes)")
     chunk = input(f"   New value [{CONFIG['chunk_size']}]: ")
-    if chunk.isdigit():
-        CONFIG['chunk_size'] = max(1024, int(chunk))
+    CONFIG['chunk_size'] = _parse_int(chunk, 1024, default=CONFIG['chunk_size'])
     
     print(f"\n3. Concurrent Downloads (1-10)")
     concurrent = input(f"   New value [{CONFIG['concurrent_downloads']}]: ")
-    if concurrent.isdigit():
-        CONFIG['concurrent_downloads'] = max(1, min(10, int(concurrent)))
+    CONFIG['concurrent_downloads'] = _parse_int(concurrent, 1, 10, CONFIG['concurrent_downloads'])
     
     print(f"\n4. Auto Rename Duplicates")
-    rename = input(f"   Enable? (y/n) [{'y' if CONFIG['auto_rename'] else 'n'}]: ").lower()
-    if rename in ['y', 'n']:
-        CONFIG['auto_rename'] = rename == 'y'
+    rename = input(f"   Enable? (y/n) [{'y' if CONFIG['auto_rename'] else 'n'}]: ")[:1]
+    if rename in _YES_NO:
+        CONFIG['auto_rename'] = rename in _YES
     
     print(f"\n5. Resume Interrupted Downloads")
-    resume = input(f"   Enable? (y/n) [{'y' if CONFIG['resume_downloads'] else 'n'}]: ").lower()
-    if resume in ['y', 'n']:
-        CONFIG['resume_downloads'] = resume == 'y'
+    resume = input(f"   Enable? (y/n) [{'y' if CONFIG['resume_downloads'] else 'n'}]: ")[:1]
+    if resume in _YES_NO:
+        CONFIG['resume_downloads'] = resume in _YES
     
     print(f"\n6. Auto Extract Archives")
-    extract = input(f"   Enable? (y/n) [{'y' if CONFIG['auto_extract'] else 'n'}]: ").lower()
-    if extract in ['y', 'n']:
-        CONFIG['auto_extract'] = extract == 'y'
+    extract = input(f"   Enable? (y/n) [{'y' if CONFIG['auto_extract'] else 'n'}]: ")[:1]
+    if extract in _YES_NO:
+        CONFIG['auto_extract'] = extract in _YES
+    
+    print(f"\n7. Save Video Info JSON")
+    info_json = input(f"   Enable? (y/n) [{'y' if CONFIG['write_info_json'] else 'n'}]: ")[:1]
+    if info_json in _YES_NO:
+        CONFIG['write_info_json'] = info_json in _YES
+    
+    print(f"\n8. Download Video Subtitles (English)")
+    subs = input(f"   Enable? (y/n) [{'y' if CONFIG['write_subs'] else 'n'}]: ")[:1]
+    if subs in _YES_NO:
+        CONFIG['write_subs'] = subs in _YES
+    
+    print(f"\n9. Download Auto-generated Subtitles (slower)")
+    auto_subs = input(f"   Enable? (y/n) [{'y' if CONFIG['write_auto_subs'] else 'n'}]: ")[:1]
+    if auto_subs in _YES_NO:
+        CONFIG['write_auto_subs'] = auto_subs in _YES
     
     print(f"{Colors.SUCCESS}✓ Download behavior updated{Colors.END}")
-    save_config()
+    mark_config_dirty()
     input(f"\n{Colors.MUTED}Press Enter to continue...{Colors.END}")
 
 def configure_security():
@@ -1262,29 +2304,29 @@ def configure_security():
     print(f"\n{Colors.ACCENT}╭─ Security Options{Colors.END}")
     
     print(f"{Colors.INFO}Current Settings:{Colors.END}")
-    print(f"{Colors.INFO}├─{Colors.END} Hash Verification: {CONFIG['hash_verification']}")
-    print(f"{Colors.INFO}├─{Colors.END} SSL Verification: {CONFIG['verify_ssl']}")
-    print(f"{Colors.INFO}├─{Colors.END} Allowed Protocols: {', '.join(CONFIG['allowed_protocols'])}")
-    print(f"{Colors.INFO}╰─{Colors.END} Blocked Extensions: {', '.join(CONFIG['blocked_extensions'])}")
+    print(f"{INFO_L} Hash Verification: {CONFIG['hash_verification']}")
+    print(f"{INFO_L} SSL Verification: {CONFIG['verify_ssl']}")
+    print(f"{INFO_L} Allowed Protocols: {', '.join(CONFIG['allowed_protocols'])}")
+    print(f"{INFO_E} Blocked Extensions: {', '.join(CONFIG['blocked_extensions'])}")
     
     print(f"\n1. Hash Verification")
-    hash_verify = input(f"   Enable file hash verification? (y/n) [{'y' if CONFIG['hash_verification'] else 'n'}]: ").lower()
-    if hash_verify in ['y', 'n']:
-        CONFIG['hash_verification'] = hash_verify == 'y'
+    hash_verify = input(f"   Enable file hash verification? (y/n) [{'y' if CONFIG['hash_verification'] else 'n'}]: ")[:1]
+    if hash_verify in _YES_NO:
+        CONFIG['hash_verification'] = hash_verify in _YES
     
     print(f"\n2. SSL/TLS Verification")
-    ssl_verify = input(f"   Enable SSL certificate verification? (y/n) [{'y' if CONFIG['verify_ssl'] else 'n'}]: ").lower()
-    if ssl_verify in ['y', 'n']:
-        CONFIG['verify_ssl'] = ssl_verify == 'y'
+    ssl_verify = input(f"   Enable SSL certificate verification? (y/n) [{'y' if CONFIG['verify_ssl'] else 'n'}]: ")[:1]
+    if ssl_verify in _YES_NO:
+        CONFIG['verify_ssl'] = ssl_verify in _YES
     
     print(f"\n3. Manage Allowed Protocols")
     print(f"   Current: {', '.join(CONFIG['allowed_protocols'])}")
-    modify_protocols = input(f"   Modify allowed protocols? (y/n): ").lower() == 'y'
+    modify_protocols = input(f"   Modify allowed protocols? (y/n): ")[:1] in _YES
     if modify_protocols:
         all_protocols = ['http', 'https', 'ftp', 'ftps', 'sftp']
         new_protocols = []
         for protocol in all_protocols:
-            allow = input(f"   Allow {protocol}? (y/n): ").lower() == 'y'
+            allow = input(f"   Allow {protocol}? (y/n): ")[:1] in _YES
             if allow:
                 new_protocols.append(protocol)
         if new_protocols:
@@ -1292,7 +2334,7 @@ def configure_security():
     
     print(f"\n4. Manage Blocked Extensions")
     print(f"   Current: {', '.join(CONFIG['blocked_extensions'])}")
-    modify_blocked = input(f"   Modify blocked extensions? (y/n): ").lower() == 'y'
+    modify_blocked = input(f"   Modify blocked extensions? (y/n): ")[:1] in _YES
     if modify_blocked:
         print(f"   Enter blocked extensions (comma-separated, with dots): ")
         blocked_input = input(f"   Example: .exe,.scr,.bat: ")
@@ -1300,7 +2342,7 @@ def configure_security():
             CONFIG['blocked_extensions'] = [ext.strip() for ext in blocked_input.split(',') if ext.strip()]
     
     print(f"{Colors.SUCCESS}✓ Security options updated{Colors.END}")
-    save_config()
+    mark_config_dirty()
     input(f"\n{Colors.MUTED}Press Enter to continue...{Colors.END}")
 
 def configure_rate_limiting():
@@ -1308,24 +2350,21 @@ def configure_rate_limiting():
     print(f"\n{Colors.ACCENT}╭─ Rate Limiting & Bandwidth{Colors.END}")
     
     print(f"{Colors.INFO}Current Settings:{Colors.END}")
-    print(f"{Colors.INFO}├─{Colors.END} Download Rate Limit: {CONFIG['download_rate_limit_kbps']} KB/s (0 = unlimited)")
-    print(f"{Colors.INFO}├─{Colors.END} Upload Rate Limit: {CONFIG['upload_rate_limit_kbps']} KB/s (0 = unlimited)")
-    print(f"{Colors.INFO}╰─{Colors.END} Bandwidth Limit: {CONFIG['bandwidth_limit']} KB/s (0 = unlimited)")
+    print(f"{INFO_L} Download Rate Limit: {CONFIG['download_rate_limit_kbps']} KB/s (0 = unlimited)")
+    print(f"{INFO_L} Upload Rate Limit: {CONFIG['upload_rate_limit_kbps']} KB/s (0 = unlimited)")
+    print(f"{INFO_E} Bandwidth Limit: {CONFIG['bandwidth_limit']} KB/s (0 = unlimited)")
     
     print(f"\n1. Download Rate Limit (KB/s)")
     download_limit = input(f"   New limit (0 for unlimited) [{CONFIG['download_rate_limit_kbps']}]: ")
-    if download_limit.isdigit():
-        CONFIG['download_rate_limit_kbps'] = int(download_limit)
+    CONFIG['download_rate_limit_kbps'] = _parse_int(download_limit, 0, default=CONFIG['download_rate_limit_kbps'])
     
     print(f"\n2. Upload Rate Limit (KB/s)")
     upload_limit = input(f"   New limit (0 for unlimited) [{CONFIG['upload_rate_limit_kbps']}]: ")
-    if upload_limit.isdigit():
-        CONFIG['upload_rate_limit_kbps'] = int(upload_limit)
+    CONFIG['upload_rate_limit_kbps'] = _parse_int(upload_limit, 0, default=CONFIG['upload_rate_limit_kbps'])
     
     print(f"\n3. Overall Bandwidth Limit (KB/s)")
     bandwidth_limit = input(f"   New limit (0 for unlimited) [{CONFIG['bandwidth_limit']}]: ")
-    if bandwidth_limit.isdigit():
-        CONFIG['bandwidth_limit'] = int(bandwidth_limit)
+    CONFIG['bandwidth_limit'] = _parse_int(bandwidth_limit, 0, default=CONFIG['bandwidth_limit'])
     
     print(f"\n4. Quick Presets")
     print(f"   1. Unlimited (default)")
@@ -1348,7 +2387,7 @@ def configure_rate_limiting():
         print(f"{Colors.SUCCESS}✓ Applied {['', 'unlimited', 'conservative', 'limited', 'minimal'][int(preset)]} preset{Colors.END}")
     
     print(f"{Colors.SUCCESS}✓ Rate limiting updated{Colors.END}")
-    save_config()
+    mark_config_dirty()
     input(f"\n{Colors.MUTED}Press Enter to continue...{Colors.END}")
 
 def configure_file_management():
@@ -1356,44 +2395,44 @@ def configure_file_management():
     print(f"\n{Colors.ACCENT}╭─ File Management{Colors.END}")
     
     print(f"{Colors.INFO}Current Settings:{Colors.END}")
-    print(f"{Colors.INFO}├─{Colors.END} Auto Cleanup: {CONFIG['auto_cleanup']}")
-    print(f"{Colors.INFO}├─{Colors.END} Check Disk Space: {CONFIG['check_disk_space']}")
-    print(f"{Colors.INFO}├─{Colors.END} Min Disk Space: {CONFIG['min_disk_space_mb']} MB")
-    print(f"{Colors.INFO}╰─{Colors.END} Auto Extract: {CONFIG['auto_extract']}")
+    print(f"{INFO_L} Auto Cleanup: {CONFIG['auto_cleanup']}")
+    print(f"{INFO_L} Check Disk Space: {CONFIG['check_disk_space']}")
+    print(f"{INFO_L} Min Disk Space: {CONFIG['min_disk_space_mb']} MB")
+    print(f"{INFO_E} Auto Extract: {CONFIG['auto_extract']}")
     
     print(f"\n1. Auto Cleanup Temporary Files")
-    cleanup = input(f"   Enable? (y/n) [{'y' if CONFIG['auto_cleanup'] else 'n'}]: ").lower()
-    if cleanup in ['y', 'n']:
-        CONFIG['auto_cleanup'] = cleanup == 'y'
+    cleanup = input(f"   Enable? (y/n) [{'y' if CONFIG['auto_cleanup'] else 'n'}]: ")[:1]
+    if cleanup in _YES_NO:
+        CONFIG['auto_cleanup'] = cleanup in _YES
     
     print(f"\n2. Check Available Disk Space")
-    check_disk = input(f"   Enable? (y/n) [{'y' if CONFIG['check_disk_space'] else 'n'}]: ").lower()
-    if check_disk in ['y', 'n']:
-        CONFIG['check_disk_space'] = check_disk == 'y'
+    check_disk = input(f"   Enable? (y/n) [{'y' if CONFIG['check_disk_space'] else 'n'}]: ")[:1]
+    if check_disk in _YES_NO:
+        CONFIG['check_disk_space'] = check_disk in _YES
     
     if CONFIG['check_disk_space']:
         print(f"\n3. Minimum Disk Space Required (MB)")
         min_space = input(f"   New value [{CONFIG['min_disk_space_mb']}]: ")
-        if min_space.isdigit():
-            CONFIG['min_disk_space_mb'] = max(10, int(min_space))
+        CONFIG['min_disk_space_mb'] = _parse_int(min_space, 10, default=CONFIG['min_disk_space_mb'])
     
     print(f"\n4. Auto Extract Archives")
-    auto_extract = input(f"   Enable automatic extraction? (y/n) [{'y' if CONFIG['auto_extract'] else 'n'}]: ").lower()
-    if auto_extract in ['y', 'n']:
-        CONFIG['auto_extract'] = auto_extract == 'y'
+    auto_extract = input(f"   Enable automatic extraction? (y/n) [{'y' if CONFIG['auto_extract'] else 'n'}]: ")[:1]
+    if auto_extract in _YES_NO:
+        CONFIG['auto_extract'] = auto_extract in _YES
     
     print(f"\n5. File Organization")
-    organize = input(f"   Create organized folder structure? (y/n): ").lower() == 'y'
+    organize = input(f"   Create organized folder structure? (y/n): ")[:1] in _YES
     if organize:
-        base_dir = CONFIG['download_dir']
         folders = ['Audio', 'Video', 'Documents', 'Archives', 'Images', 'Software', 'Other']
-        for folder in folders:
-            folder_path = os.path.join(base_dir, folder)
-            os.makedirs(folder_path, exist_ok=True)
-        print(f"{Colors.SUCCESS}✓ Created organized folder structure{Colors.END}")
+        failed = [(path, error) for path, error in create_directories(CONFIG['download_dir'], folders) if error]
+        if failed:
+            for path, error in failed:
+                print(f"{Colors.ERROR}✗ Failed to create {path}: {error}{Colors.END}")
+        else:
+            print(f"{Colors.SUCCESS}✓ Created organized folder structure{Colors.END}")
     
     print(f"{Colors.SUCCESS}✓ File management updated{Colors.END}")
-    save_config()
+    mark_config_dirty()
     input(f"\n{Colors.MUTED}Press Enter to continue...{Colors.END}")
 
 def configure_system_resources():
@@ -1401,79 +2440,77 @@ def configure_system_resources():
     print(f"\n{Colors.ACCENT}╭─ System Resources{Colors.END}")
     
     # Get system info for recommendations
-    try:
-        import psutil
-        cpu_count = psutil.cpu_count()
-        memory_gb = psutil.virtual_memory().total / (1024**3)
-        disk_free_gb = psutil.disk_usage('.').free / (1024**3)
-        
-        print(f"{Colors.INFO}System Information:{Colors.END}")
-        print(f"{Colors.INFO}├─{Colors.END} CPU Cores: {cpu_count}")
-        print(f"{Colors.INFO}├─{Colors.END} Memory: {memory_gb:.1f} GB")
-        print(f"{Colors.INFO}╰─{Colors.END} Free Disk: {disk_free_gb:.1f} GB")
-        
-    except ImportError:
-        cpu_count = os.cpu_count() or 4
-        print(f"{Colors.INFO}CPU Cores: {cpu_count} (install psutil for detailed info){Colors.END}")
-    
-    print(f"\n{Colors.INFO}Current Settings:{Colors.END}")
-    print(f"{Colors.INFO}├─{Colors.END} Max Threads: {CONFIG['max_threads']}")
-    print(f"{Colors.INFO}├─{Colors.END} Chunk Size: {CONFIG['chunk_size']} bytes")
-    print(f"{Colors.INFO}├─{Colors.END} Connection Pool: {CONFIG['connection_pool_size']}")
-    print(f"{Colors.INFO}╰─{Colors.END} Concurrent Downloads: {CONFIG['concurrent_downloads']}")
+    cpu_count, memory_gb, disk_free_gb = _system_snapshot(int(time.monotonic()) // SYSTEM_SNAPSHOT_TTL)
+    if memory_gb is not None:
+        system_lines = (
+            f"{Colors.INFO}System Information:{Colors.END}",
+            f"{INFO_L} CPU Cores: {cpu_count}",
+            f"{INFO_L} Memory: {memory_gb:.1f} GB",
+            f"{INFO_E} Free Disk: {disk_free_gb:.1f} GB",
+        )
+    else:
+        system_lines = (f"{Colors.INFO}CPU Cores: {cpu_count} (install psutil for detailed info){Colors.END}",)
+    
+    # Each block goes out in one write rather than a print per line
+    print("\n".join((
+        *system_lines,
+        f"\n{Colors.INFO}Current Settings:{Colors.END}",
+        f"{INFO_L} Max Threads: {CONFIG['max_threads']}",
+        f"{INFO_L} Chunk Size: {CONFIG['chunk_size']} bytes",
+        f"{INFO_L} Connection Pool: {CONFIG['connection_pool_size']}",
+        f"{INFO_E} Concurrent Downloads: {CONFIG['concurrent_downloads']}",
+    )))
     
     print(f"\n1. Optimize for System")
-    optimize = input(f"   Auto-optimize settings for this system? (y/n): ").lower() == 'y'
+    optimize = input(f"   Auto-optimize settings for this system? (y/n): ")[:1] in _YES
     if optimize:
         # Conservative optimization based on system resources
-        CONFIG['max_threads'] = min(16, max(4, cpu_count * 2))
+        CONFIG['max_threads'] = _clamp(cpu_count * 2, 4, 16)
         CONFIG['chunk_size'] = 1048576  # 1MB chunks
-        CONFIG['connection_pool_size'] = min(20, max(5, cpu_count))
-        CONFIG['concurrent_downloads'] = min(6, max(2, cpu_count // 2))
+        CONFIG['connection_pool_size'] = _clamp(cpu_count, 5, 20)
+        CONFIG['concurrent_downloads'] = _clamp(cpu_count // 2, 2, 6)
         print(f"{Colors.SUCCESS}✓ Settings optimized for system{Colors.END}")
     else:
         print(f"\n2. Manual Configuration")
         
         threads = input(f"   Max threads (1-32) [{CONFIG['max_threads']}]: ")
-        if threads.isdigit():
-            CONFIG['max_threads'] = max(1, min(32, int(threads)))
+        CONFIG['max_threads'] = _parse_int(threads, 1, 32, CONFIG['max_threads'])
         
         chunk_size = input(f"   Chunk size in KB (64-8192) [{CONFIG['chunk_size']//1024}]: ")
-        if chunk_size.isdigit():
-            CONFIG['chunk_size'] = max(65536, min(8388608, int(chunk_size) * 1024))
+        if (chunk_kb := _parse_int(chunk_size, 64, 8192)) is not None:
+            CONFIG['chunk_size'] = chunk_kb * 1024
         
         pool_size = input(f"   Connection pool size (1-50) [{CONFIG['connection_pool_size']}]: ")
-        if pool_size.isdigit():
-            CONFIG['connection_pool_size'] = max(1, min(50, int(pool_size)))
+        CONFIG['connection_pool_size'] = _parse_int(pool_size, 1, 50, CONFIG['connection_pool_size'])
         
         concurrent = input(f"   Concurrent downloads (1-10) [{CONFIG['concurrent_downloads']}]: ")
-        if concurrent.isdigit():
-            CONFIG['concurrent_downloads'] = max(1, min(10, int(concurrent)))
+        CONFIG['concurrent_downloads'] = _parse_int(concurrent, 1, 10, CONFIG['concurrent_downloads'])
     
     print(f"{Colors.SUCCESS}✓ System resources configured{Colors.END}")
-    save_config()
+    mark_config_dirty()
     input(f"\n{Colors.MUTED}Press Enter to continue...{Colors.END}")
 
 def configure_logging():
     """Configure logging and history settings"""
-    print(f"\n{Colors.ACCENT}╭─ Logging & History{Colors.END}")
-    
-    print(f"{Colors.INFO}Current Settings:{Colors.END}")
-    print(f"{Colors.INFO}├─{Colors.END} Download History: {CONFIG['download_history']}")
-    print(f"{Colors.INFO}├─{Colors.END} Log Level: {CONFIG['log_level']}")
-    print(f"{Colors.INFO}├─{Colors.END} Log File: {CONFIG['log_file']}")
-    print(f"{Colors.INFO}╰─{Colors.END} Notification Sound: {CONFIG['notification_sound']}")
+    print("\n".join((
+        f"\n{Colors.ACCENT}╭─ Logging & History{Colors.END}",
+        f"{Colors.INFO}Current Settings:{Colors.END}",
+        f"{INFO_L} Download History: {CONFIG['download_history']}",
+        f"{INFO_L} Log Level: {CONFIG['log_level']}",
+        f"{INFO_L} Log File: {CONFIG['log_file']}",
+        f"{INFO_E} Notification Sound: {CONFIG['notification_sound']}",
+    )))
     
     print(f"\n1. Download History")
-    history = input(f"   Enable download history? (y/n) [{'y' if CONFIG['download_history'] else 'n'}]: ").lower()
-    if history in ['y', 'n']:
-        CONFIG['download_history'] = history == 'y'
+    history = input(f"   Enable download history? (y/n) [{'y' if CONFIG['download_history'] else 'n'}]: ")[:1]
+    if history in _YES_NO:
+        CONFIG['download_history'] = history in _YES
     
-    print(f"\n2. Log Level")
-    print(f"   1. DEBUG (verbose)")
-    print(f"   2. INFO (normal)")
-    print(f"   3. WARNING (errors only)")
-    print(f"   4. ERROR (critical only)")
+    print("\n2. Log Level\n"
+          "   1. DEBUG (verbose)\n"
+          "   2. INFO (normal)\n"
+          "   3. WARNING (errors only)\n"
+          "   4. ERROR (critical only)")
     
     log_choice = input(f"   Select log level (1-4): ")
     log_levels = {'1': 'DEBUG', '2': 'INFO', '3': 'WARNING', '4': 'ERROR'}
@@ -1486,37 +2523,38 @@ def configure_logging():
         CONFIG['log_file'] = os.path.expanduser(new_log.strip())
     
     print(f"\n4. Notification Sound")
-    sound = input(f"   Enable notification sounds? (y/n) [{'y' if CONFIG['notification_sound'] else 'n'}]: ").lower()
-    if sound in ['y', 'n']:
-        CONFIG['notification_sound'] = sound == 'y'
+    sound = input(f"   Enable notification sounds? (y/n) [{'y' if CONFIG['notification_sound'] else 'n'}]: ")[:1]
+    if sound in _YES_NO:
+        CONFIG['notification_sound'] = sound in _YES
     
     print(f"\n5. Clear History")
-    clear_history = input(f"   Clear download history? (y/n): ").lower() == 'y'
+    clear_history = input(f"   Clear download history? (y/n): ")[:1] in _YES
     if clear_history:
-        global DOWNLOAD_HISTORY
         DOWNLOAD_HISTORY.clear()
+        save_history()
         print(f"{Colors.SUCCESS}✓ Download history cleared{Colors.END}")
     
     print(f"{Colors.SUCCESS}✓ Logging configuration updated{Colors.END}")
-    save_config()
+    mark_config_dirty()
     input(f"\n{Colors.MUTED}Press Enter to continue...{Colors.END}")
 
 def import_export_config():
     """Import/Export configuration"""
-    print(f"\n{Colors.ACCENT}╭─ Configuration Import/Export{Colors.END}")
-    
-    print(f"{Colors.ACCENT}├─{Colors.END} 1. Export current configuration")
-    print(f"{Colors.ACCENT}├─{Colors.END} 2. Import configuration from file")
-    print(f"{Colors.ACCENT}├─{Colors.END} 3. Export download history")
-    print(f"{Colors.ACCENT}╰─{Colors.END} 4. Import download history")
+    print("\n".join((
+        f"\n{Colors.ACCENT}╭─ Configuration Import/Export{Colors.END}",
+        f"{ACC_L} 1. Export current configuration",
+        f"{ACC_L} 2. Import configuration from file",
+        f"{ACC_L} 3. Export download history",
+        f"{ACC_E} 4. Import download history",
+    )))
     
     choice = input(f"\n{Colors.BOLD}Select option (1-4): {Colors.END}")
     
     if choice == '1':
         export_path = input(f"Export path [./xternal_config.json]: ") or "./xternal_config.json"
         try:
-            with open(export_path, 'w') as f:
-                json.dump(CONFIG, f, indent=2)
+            # Encode once and write once; json.dump issues a write() per token
+            Path(export_path).write_bytes(_json_dumps(CONFIG, indent=True))
             print(f"{Colors.SUCCESS}✓ Configuration exported to {export_path}{Colors.END}")
         except Exception as e:
             print(f"{Colors.ERROR}✗ Export failed: {e}{Colors.END}")
@@ -1525,15 +2563,12 @@ def import_export_config():
         import_path = input(f"Import path: ")
         if os.path.exists(import_path):
             try:
-                with open(import_path, 'r') as f:
-                    imported_config = json.load(f)
+                imported_config = _load_json_file(import_path)
                 
-                # Update CONFIG with imported values
-                for key, value in imported_config.items():
-                    if key in CONFIG:
-                        CONFIG[key] = value
+                # Update CONFIG with imported values for known keys
+                CONFIG.update((key, value) for key, value in imported_config.items() if key in CONFIG)
                 
-                save_config()
+                mark_config_dirty()
                 print(f"{Colors.SUCCESS}✓ Configuration imported from {import_path}{Colors.END}")
             except Exception as e:
                 print(f"{Colors.ERROR}✗ Import failed: {e}{Colors.END}")
@@ -1543,8 +2578,12 @@ def import_export_config():
     elif choice == '3':
         export_path = input(f"Export path [./download_history.json]: ") or "./download_history.json"
         try:
-            with open(export_path, 'w') as f:
-                json.dump(DOWNLOAD_HISTORY, f, indent=2)
+            flush_history()
+            if _HISTORY_SYNCED and os.path.exists(HISTORY_FILE):
+                # The saved history is already serialized in the export format; copy it as-is
+                copy_file(HISTORY_FILE, export_path)
+            else:
+                write_history_json(export_path)
             print(f"{Colors.SUCCESS}✓ Download history exported to {export_path}{Colors.END}")
         except Exception as e:
             print(f"{Colors.ERROR}✗ Export failed: {e}{Colors.END}")
@@ -1553,9 +2592,8 @@ def import_export_config():
         import_path = input(f"Import path: ")
         if os.path.exists(import_path):
             try:
-                with open(import_path, 'r') as f:
-                    DOWNLOAD_HISTORY.clear()
-                    DOWNLOAD_HISTORY.extend(json.load(f))
+                DOWNLOAD_HISTORY[:] = _load_json_file(import_path)
+                save_history()
                 print(f"{Colors.SUCCESS}✓ Download history imported from {import_path}{Colors.END}")
             except Exception as e:
                 print(f"{Colors.ERROR}✗ Import failed: {e}{Colors.END}")
@@ -1566,24 +2604,30 @@ def import_export_config():
 
 def reset_to_defaults():
     """Reset configuration to defaults"""
-    print(f"\n{Colors.WARNING}╭─ Reset Configuration{Colors.END}")
-    print(f"{Colors.WARNING}├─{Colors.END} This will reset ALL settings to defaults")
-    print(f"{Colors.WARNING}├─{Colors.END} Download history will be preserved")
-    print(f"{Colors.WARNING}╰─{Colors.END} This action cannot be undone")
+    print("\n".join((
+        f"\n{Colors.WARNING}╭─ Reset Configuration{Colors.END}",
+        f"{Colors.WARNING}├─{Colors.END} This will reset ALL settings to defaults",
+        f"{Colors.WARNING}├─{Colors.END} Download history will be preserved",
+        f"{Colors.WARNING}╰─{Colors.END} This action cannot be undone",
+    )))
     
     confirm = input(f"\n{Colors.ACCENT}Are you sure? Type 'RESET' to confirm: {Colors.END}")
     if confirm == 'RESET':
         global CONFIG
         CONFIG = DEFAULT_CONFIG.copy()
-        save_config()
+        mark_config_dirty()
         print(f"{Colors.SUCCESS}✓ Configuration reset to defaults{Colors.END}")
     else:
         print(f"{Colors.INFO}Reset cancelled{Colors.END}")
     
     input(f"\n{Colors.MUTED}Press Enter to continue...{Colors.END}")
 
+@functools.lru_cache(maxsize=1)
 def create_parser():
-    """Create argument parser for the XTERNAL module."""
+    """Create argument parser for the XTERNAL module (built once and reused)."""
+    # Imported here so runs that never parse arguments (e.g. --help) skip loading argparse
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description=__description__,
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1614,65 +2658,91 @@ def create_parser():
     
     return parser
 
+# Rendered once at import; only the yt-dlp availability marker changes between redraws
+_MAIN_MENU = "\n".join((
+    f"{Colors.PRIMARY}╭─ Main Menu{Colors.END}",
+    f"{Colors.PRIMARY}├─{Colors.END} Download Options",
+    f"{Colors.PRIMARY}│{Colors.END}  {Colors.SUCCESS}1.{Colors.END} HTTP/HTTPS Download",
+    f"{Colors.PRIMARY}│{Colors.END}  {Colors.SUCCESS}2.{Colors.END} FTP/FTPS Download",
+    f"{Colors.PRIMARY}│{Colors.END}  {Colors.SUCCESS}3.{Colors.END} YouTube/Video Download{{unavailable}}",
+    f"{Colors.PRIMARY}│{Colors.END}  {Colors.SUCCESS}4.{Colors.END} Batch Download Manager",
+    f"{Colors.PRIMARY}├─{Colors.END} System Management",
+    f"{Colors.PRIMARY}│{Colors.END}  {Colors.ACCENT}5.{Colors.END} Advanced Settings",
+    f"{Colors.PRIMARY}│{Colors.END}  {Colors.ACCENT}6.{Colors.END} Network Diagnostics",
+    f"{Colors.PRIMARY}│{Colors.END}  {Colors.ACCENT}7.{Colors.END} Download History",
+    f"{Colors.PRIMARY}╰─{Colors.END}  {Colors.WARNING}8.{Colors.END} Return to CrossFire",
+))
+_UNAVAILABLE = f" {Colors.ERROR}(Unavailable){Colors.END}"
+
 def xternal_main_menu():
     """Original XTERNAL main menu functionality"""
     # Load configuration at startup
     load_config()
+    load_history()
+    
+    # Prompts used on every pass of the loop, rendered once up front
+    select_prompt = f"\n{Colors.BOLD}▶ Select option (1-8): {Colors.END}"
+    pause_prompt = f"\n{Colors.MUTED}Press Enter to continue...{Colors.END}"
     
     try:
         while True:
             print_header()
             
-            print(f"{Colors.PRIMARY}╭─ Main Menu{Colors.END}")
-            print(f"{Colors.PRIMARY}├─{Colors.END} Download Options")
-            print(f"{Colors.PRIMARY}│{Colors.END}  {Colors.SUCCESS}1.{Colors.END} HTTP/HTTPS Download")
-            print(f"{Colors.PRIMARY}│{Colors.END}  {Colors.SUCCESS}2.{Colors.END} FTP/FTPS Download")
-            unavailable_text = f" {Colors.ERROR}(Unavailable){Colors.END}" if not YTDLP_AVAILABLE else ""
-            print(f"{Colors.PRIMARY}│{Colors.END}  {Colors.SUCCESS}3.{Colors.END} YouTube/Video Download{unavailable_text}")
-            print(f"{Colors.PRIMARY}│{Colors.END}  {Colors.SUCCESS}4.{Colors.END} Batch Download Manager")
-            print(f"{Colors.PRIMARY}├─{Colors.END} System Management")
-            print(f"{Colors.PRIMARY}│{Colors.END}  {Colors.ACCENT}5.{Colors.END} Advanced Settings")
-            print(f"{Colors.PRIMARY}│{Colors.END}  {Colors.ACCENT}6.{Colors.END} Network Diagnostics")
-            print(f"{Colors.PRIMARY}│{Colors.END}  {Colors.ACCENT}7.{Colors.END} Download History")
-            print(f"{Colors.PRIMARY}╰─{Colors.END}  {Colors.WARNING}8.{Colors.END} Return to CrossFire")
+            print(_MAIN_MENU.format(unavailable="" if ytdlp_installed() else _UNAVAILABLE))
             
-            choice = input(f"\n{Colors.BOLD}▶ Select option (1-8): {Colors.END}")
+            choice = input(select_prompt)
             
             if choice == '1':
                 url = input(f"\n{Colors.PRIMARY}Enter download URL: {Colors.END}")
                 if url:
                     professional_download(url)
-                    input(f"\n{Colors.MUTED}Press Enter to continue...{Colors.END}")
+                    flush_history()
+                    input(pause_prompt)
             
             elif choice == '2':
                 advanced_ftp_download()
-                input(f"\n{Colors.MUTED}Press Enter to continue...{Colors.END}")
+                input(pause_prompt)
             
             elif choice == '3':
-                if YTDLP_AVAILABLE:
+                if load_ytdlp():
                     youtube_download()
+                    flush_history()
                 else:
                     print(f"{Colors.ERROR}✗ yt-dlp not available{Colors.END}")
                     print(f"{Colors.INFO}Install with: pip install yt-dlp{Colors.END}")
                     
-                    # Offer to install yt-dlp
-                    install = input(f"{Colors.ACCENT}Install yt-dlp now? (y/N): {Colors.END}").lower()
-                    if install == 'y':
+                    try:
+                        installed_version = importlib.metadata.version('yt-dlp')
+                    except importlib.metadata.PackageNotFoundError:
+                        installed_version = None
+                    
+                    if installed_version:
+                        # Installed but not importable: a pip install would be a no-op
+                        print(f"{Colors.WARNING}⚠ yt-dlp {installed_version} is installed but failed to import{Colors.END}")
+                    elif input(f"{Colors.ACCENT}Install yt-dlp now? (y/N): {Colors.END}")[:1] in _YES:
                         try:
                             print(f"{Colors.INFO}▶ Installing yt-dlp...{Colors.END}")
                             subprocess.check_call([sys.executable, '-m', 'pip', 'install', 'yt-dlp'])
-                            print(f"{Colors.SUCCESS}✓ yt-dlp installed successfully! Please restart XTERNAL.{Colors.END}")
+                            if load_ytdlp(retry=True):
+                                print(f"{Colors.SUCCESS}✓ yt-dlp installed successfully!{Colors.END}")
+                                youtube_download()
+                                flush_history()
+                            else:
+                                print(f"{Colors.WARNING}⚠ yt-dlp installed, but it could not be loaded. Please restart XTERNAL.{Colors.END}")
                         except subprocess.CalledProcessError as e:
                             print(f"{Colors.ERROR}✗ Installation failed: {str(e)}{Colors.END}")
                 
-                input(f"\n{Colors.MUTED}Press Enter to continue...{Colors.END}")
+                input(pause_prompt)
             
             elif choice == '4':
                 batch_download_manager()
-                input(f"\n{Colors.MUTED}Press Enter to continue...{Colors.END}")
+                input(pause_prompt)
             
             elif choice == '5':
-                advanced_settings_menu()
+                try:
+                    advanced_settings_menu()
+                finally:
+                    flush_config()
             
             elif choice == '6':
                 print(f"\n{Colors.INFO}╭─ Network Diagnostics{Colors.END}")
@@ -1684,7 +2754,7 @@ def xternal_main_menu():
                 print(f"\n{Colors.INFO}├─ System Information{Colors.END}")
                 for key, value in system_info.items():
                     if key != 'error':
-                        print(f"{Colors.INFO}│{Colors.END}  {key.replace('_', ' ').title()}: {value}")
+                        print(f"{INFO_V}  {key.replace('_', ' ').title()}: {value}")
                     else:
                         print(f"{Colors.WARNING}│{Colors.END}  {value}")
                 
@@ -1693,7 +2763,7 @@ def xternal_main_menu():
                     if key != 'error':
                         display_key = key.replace('_', ' ').title()
                         color = Colors.SUCCESS if key == 'vpn_detected' and value else Colors.END
-                        print(f"{Colors.INFO}│{Colors.END}  {display_key}: {color}{value}{Colors.END}")
+                        print(f"{INFO_V}  {display_key}: {color}{value}{Colors.END}")
                 
                 print(f"\n{Colors.INFO}╰─ Performance Metrics{Colors.END}")
                 print(f"{Colors.INFO} {Colors.END}  Session Downloads: {STATS['total_downloads']}")
@@ -1701,21 +2771,22 @@ def xternal_main_menu():
                 print(f"{Colors.INFO} {Colors.END}  Average Speed: {STATS['average_speed']:.1f} MB/s")
                 print(f"{Colors.INFO} {Colors.END}  Failed Downloads: {STATS['failed_downloads']}")
                 
-                input(f"\n{Colors.MUTED}Press Enter to continue...{Colors.END}")
+                input(pause_prompt)
             
             elif choice == '7':
                 if not DOWNLOAD_HISTORY:
                     print(f"{Colors.WARNING}⚠ No download history available{Colors.END}")
                 else:
-                    print(f"\n{Colors.INFO}╭─ Download History ({len(DOWNLOAD_HISTORY)} items){Colors.END}")
+                    # Rendered into one string and printed once
+                    lines = [f"\n{Colors.INFO}╭─ Download History ({len(DOWNLOAD_HISTORY)} items){Colors.END}"]
                     for i, item in enumerate(DOWNLOAD_HISTORY[-10:], 1):
-                        timestamp = datetime.fromisoformat(item['timestamp']).strftime("%m/%d %H:%M")
-                        size_mb = item['size'] / 1024 / 1024
-                        print(f"{Colors.INFO}├─{Colors.END} [{i}] {item['filename'][:40]}")
-                        print(f"{Colors.INFO}│{Colors.END}     Size: {size_mb:.1f}MB | Speed: {item['speed']:.1f}MB/s | {timestamp}")
-                    print(f"{Colors.INFO}╰─{Colors.END} Showing last 10 downloads")
+                        lines.append(f"{INFO_L} [{i}] {item['filename'][:40]}")
+                        lines.append(f"{INFO_V}     Size: {item['size'] * _MIB:.1f}MB | Speed: {item['speed']:.1f}MB/s | {_fmt_ts(item['timestamp_ns'])}")
+                    lines.append(f"{INFO_L} Total: {format_size(DOWNLOAD_HISTORY.total_size())} | Avg Speed: {DOWNLOAD_HISTORY.average_speed():.1f}MB/s")
+                    lines.append(f"{INFO_E} Showing last 10 downloads")
+                    print("\n".join(lines))
                 
-                input(f"\n{Colors.MUTED}Press Enter to continue...{Colors.END}")
+                input(pause_prompt)
             
             elif choice == '8':
                 print(f"{Colors.SUCCESS}✓ Returning to CrossFire...{Colors.END}")
@@ -1731,6 +2802,24 @@ def xternal_main_menu():
     except Exception as e:
         print(f"\n{Colors.ERROR}✗ XTERNAL error: {str(e)}{Colors.END}")
         return 1
+    finally:
+        flush_history()
+
+def parse_args_fast(args):
+    """Scan the fixed CLI flags without argparse; None if args need the full parser (unknown flags, missing values)"""
+    parsed = SimpleNamespace(interactive=False, url=None, batch=None, help=False)
+    it = iter(args)
+    for arg in it:
+        if arg == '--interactive':
+            parsed.interactive = True
+        elif arg in ('--url', '--batch'):
+            value = next(it, None)
+            if value is None or value.startswith('-'):
+                return None
+            setattr(parsed, arg[2:], value)
+        else:
+            return None
+    return parsed
 
 def main(args: List[str]) -> int:
     """
@@ -1743,22 +2832,22 @@ def main(args: List[str]) -> int:
         int: Exit code (0 for success, non-zero for error)
     """
     try:
+        # Handle help manually since we disabled argparse's help; it needs no config or parser
+        if "--help" in args or "-h" in args:
+            print(__help__)
+            return 0
+        
         # Load configuration at startup
         load_config()
-        
-        parser = create_parser()
+        load_history()
         
         # If no args provided, default to interactive mode
         if not args:
             args = ["--interactive"]
         
-        # Handle help manually since we disabled argparse's help
-        if "--help" in args or "-h" in args:
-            print(__help__)
-            return 0
-        
         try:
-            parsed_args = parser.parse_args(args)
+            # argparse is only needed to report bad arguments
+            parsed_args = parse_args_fast(args) or create_parser().parse_args(args)
         except SystemExit as e:
             # argparse calls sys.exit(), catch it and return the code
             return e.code if e.code else 1
@@ -1776,21 +2865,16 @@ def main(args: List[str]) -> int:
                 return 1
             
             try:
-                with open(parsed_args.batch, 'r') as f:
-                    urls = [line.strip() for line in f if line.strip()]
-                
-                if not urls:
+                # Count first so progress shows [i/total], then stream the file while downloading
+                total = count_urls(parsed_args.batch)
+                if not total:
                     print(f"{Colors.WARNING}⚠ No URLs found in batch file{Colors.END}")
                     return 1
                 
-                successful = 0
-                for i, url in enumerate(urls, 1):
-                    print(f"\n{Colors.ACCENT}[{i}/{len(urls)}] Processing: {url[:60]}...{Colors.END}")
-                    if professional_download(url, show_progress=False):
-                        successful += 1
+                successful, total = run_batch(iter_urls(parsed_args.batch), max(1, CONFIG['concurrent_downloads']), total)
                 
-                print(f"\n{Colors.SUCCESS}✓ Batch complete: {successful}/{len(urls)} successful{Colors.END}")
-                return 0 if successful == len(urls) else 1
+                print(f"\n{Colors.SUCCESS}✓ Batch complete: {successful}/{total} successful{Colors.END}")
+                return 0 if successful == total else 1
                 
             except Exception as e:
                 print(f"{Colors.ERROR}✗ Batch processing error: {e}{Colors.END}")
@@ -1804,6 +2888,8 @@ def main(args: List[str]) -> int:
     except Exception as e:
         print(f"{Colors.ERROR}✗ XTERNAL module error: {str(e)}{Colors.END}")
         return 1
+    finally:
+        flush_history()
 
 
 # Allow module to be run standalone for testing